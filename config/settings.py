@@ -3,166 +3,251 @@ Configuration settings for Project Sloppenhimer.
 Uses Pydantic Settings for type-safe environment variable handling.
 """
 
+import os
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Literal
 
+from dotenv import dotenv_values
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import (
+    BaseSettings,
+    EnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
 
+ENV_FILE = ".env"
 
-class RedditSettings(BaseSettings):
-    """Reddit scraping configuration (no API key required - uses YARS)."""
+# Resolved once; constant for the lifetime of the process
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
-    model_config = SettingsConfigDict(env_prefix="REDDIT_")
 
-    subreddits: list[str] = Field(
-        default=["AITA", "tifu", "AmItheAsshole", "relationships", "confession"],
-        description="Subreddits to scrape",
+def _load_dotenv(env_file: str = ENV_FILE) -> Mapping[str, str]:
+    """Parse the dotenv file, dropping keys without a value."""
+    return MappingProxyType(
+        {k: v for k, v in dotenv_values(env_file).items() if v is not None}
     )
-    posts_per_subreddit: int = Field(default=25, description="Posts to fetch per sub")
-    min_score: int = Field(default=100, description="Minimum post score")
-    min_length: int = Field(default=500, description="Minimum story length in chars")
-    max_length: int = Field(default=5000, description="Maximum story length in chars")
 
 
-class OllamaSettings(BaseSettings):
-    """Ollama LLM configuration."""
+# Parsed once at import; Settings() reads from this instead of the dotenv file
+_DOTENV_CACHE = _load_dotenv()
+
+
+class CachedEnvSettingsSource(EnvSettingsSource):
+    """
+    Environment source over the cached dotenv values.
+
+    The live process environment is overlaid on every load, so variables
+    set after import still apply to a new Settings().
+    """
 
-    model_config = SettingsConfigDict(env_prefix="OLLAMA_")
+    def _load_env_vars(self) -> Mapping[str, str | None]:
+        env = {**_DOTENV_CACHE, **os.environ}
+        if self.case_sensitive:
+            return env
+        return {k.lower(): v for k, v in env.items()}
 
-    host: str = Field(default="http://localhost:11434", description="Ollama API host")
-    model: str = Field(default="llama3.2:3b", description="Model to use")
-    timeout: int = Field(default=120, description="Request timeout in seconds")
 
+class SettingsGroup:
+    """Attribute view over the ``<prefix>_*`` fields of a flat Settings."""
 
-class TTSSettings(BaseSettings):
-    """Text-to-Speech configuration."""
+    __slots__ = ("_settings", "_prefix")
 
-    model_config = SettingsConfigDict(env_prefix="")
+    def __init__(self, settings: "Settings", prefix: str):
+        object.__setattr__(self, "_settings", settings)
+        object.__setattr__(self, "_prefix", prefix)
 
-    engine: Literal["edge-tts", "piper"] = Field(
+    def __getattr__(self, name: str):
+        return getattr(self._settings, f"{self._prefix}_{name}")
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._settings, f"{self._prefix}_{name}", value)
+
+    def __repr__(self) -> str:
+        prefix = f"{self._prefix}_"
+        fields = ", ".join(
+            f"{name[len(prefix):]}={getattr(self._settings, name)!r}"
+            for name in type(self._settings).model_fields
+            if name.startswith(prefix)
+        )
+        return f"SettingsGroup({self._prefix}: {fields})"
+
+
+class Settings(BaseSettings):
+    """
+    Main application settings.
+
+    Fields are flat and named ``<group>_<field>`` so the environment is
+    parsed by a single settings source. Grouped access such as
+    ``settings.video.width`` goes through SettingsGroup views.
+    """
+
+    model_config = SettingsConfigDict(extra="ignore")
+
+    # Reddit scraping configuration (no API key required - uses YARS)
+    reddit_subreddits: list[str] = Field(
+        default=["AITA", "tifu", "AmItheAsshole", "relationships", "confession"],
+        description="Subreddits to scrape",
+    )
+    reddit_posts_per_subreddit: int = Field(default=25, description="Posts to fetch per sub")
+    reddit_min_score: int = Field(default=100, description="Minimum post score")
+    reddit_min_length: int = Field(default=500, description="Minimum story length in chars")
+    reddit_max_length: int = Field(default=5000, description="Maximum story length in chars")
+
+    # Ollama LLM configuration
+    ollama_host: str = Field(default="http://localhost:11434", description="Ollama API host")
+    ollama_model: str = Field(
+        default="llama3.2:3b",
+        description=(
+            "Model to use; prefer a Q4_K_M tag (e.g. llama3.1:8b-instruct-q4_K_M) "
+            "for throughput, or q8_0 when quality matters more"
+        ),
+    )
+    ollama_keep_alive: str = Field(
+        default="24h",
+        description="How long Ollama keeps the model loaded between requests",
+    )
+    ollama_timeout: int = Field(default=120, description="Request timeout in seconds")
+    ollama_max_tokens: int = Field(
+        default=4096, description="Upper bound on generated tokens per story"
+    )
+    ollama_parallel: int = Field(
+        default=4,
+        description="Concurrent requests in process_batch (match OLLAMA_NUM_PARALLEL)",
+    )
+
+    # Text-to-Speech configuration
+    tts_engine: Literal["edge-tts", "piper"] = Field(
         default="edge-tts",
         alias="TTS_ENGINE",
         description="TTS engine to use",
     )
-    edge_voice: str = Field(
+    tts_edge_voice: str = Field(
         default="en-US-ChristopherNeural",
         alias="EDGE_TTS_VOICE",
         description="Edge TTS voice",
     )
-    piper_voice: str = Field(
+    tts_piper_voice: str = Field(
         default="en_US-amy-medium",
         alias="PIPER_VOICE",
         description="Piper TTS voice model",
     )
-    speech_rate: str = Field(
+    tts_speech_rate: str = Field(
         default="+0%",
         alias="TTS_SPEECH_RATE",
         description="Speech rate adjustment",
     )
 
-
-class VideoSettings(BaseSettings):
-    """Video processing configuration."""
-
-    model_config = SettingsConfigDict(env_prefix="")
-
-    width: int = Field(
+    # Video processing configuration
+    video_width: int = Field(
         default=1080,
         alias="OUTPUT_RESOLUTION_WIDTH",
         description="Output video width",
     )
-    height: int = Field(
+    video_height: int = Field(
         default=1920,
         alias="OUTPUT_RESOLUTION_HEIGHT",
         description="Output video height (9:16 vertical)",
     )
-    fps: int = Field(default=30, alias="VIDEO_FPS", description="Output FPS")
-    codec: str = Field(default="libx264", description="Video codec")
-    audio_codec: str = Field(default="aac", description="Audio codec")
-    bitrate: str = Field(default="8M", description="Video bitrate")
-
-
-class CaptionSettings(BaseSettings):
-    """Caption/subtitle configuration."""
-
-    model_config = SettingsConfigDict(env_prefix="CAPTION_")
+    video_fps: int = Field(default=30, alias="VIDEO_FPS", description="Output FPS")
+    video_codec: str = Field(default="libx264", alias="CODEC", description="Video codec")
+    video_audio_codec: str = Field(default="aac", alias="AUDIO_CODEC", description="Audio codec")
+    video_bitrate: str = Field(default="8M", alias="BITRATE", description="Video bitrate")
+    video_background_cache_size: int = Field(
+        default=10, description="Prepared background videos kept in the cache"
+    )
+    video_hardware_encoding: bool = Field(
+        default=True,
+        description="Use a GPU/ASIC H.264 encoder (NVENC, VideoToolbox, QSV) when available",
+    )
 
-    font: str = Field(
+    # Caption/subtitle configuration
+    caption_font: str = Field(
         default=r"C:\Windows\Fonts\arialbd.ttf",
         description="Caption font (absolute path to .ttf)",
     )
-    font_size: int = Field(default=60, description="Caption font size")
-    color: str = Field(default="white", description="Default text color")
-    highlight_color: str = Field(default="yellow", description="Active word color")
-    stroke_color: str = Field(default="black", description="Text outline color")
-    stroke_width: int = Field(default=3, description="Text outline width")
-    position: str = Field(default="center", description="Caption position")
-    words_per_group: int = Field(default=4, description="Words to show at once")
-
-
-class Settings(BaseSettings):
-    """Main application settings."""
-
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
-
-    # Sub-configurations
-    reddit: RedditSettings = Field(default_factory=RedditSettings)
-    ollama: OllamaSettings = Field(default_factory=OllamaSettings)
-    tts: TTSSettings = Field(default_factory=TTSSettings)
-    video: VideoSettings = Field(default_factory=VideoSettings)
-    caption: CaptionSettings = Field(default_factory=CaptionSettings)
+    caption_font_size: int = Field(default=60, description="Caption font size")
+    caption_color: str = Field(default="white", description="Default text color")
+    caption_highlight_color: str = Field(default="yellow", description="Active word color")
+    caption_stroke_color: str = Field(default="black", description="Text outline color")
+    caption_stroke_width: int = Field(default=3, description="Text outline width")
+    caption_position: str = Field(default="center", description="Caption position")
+    caption_words_per_group: int = Field(default=4, description="Words to show at once")
 
     # Paths
     project_root: Path = Field(
-        default_factory=lambda: Path(__file__).parent.parent,
+        default=_PROJECT_ROOT,
         description="Project root directory",
     )
 
-    @property
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return (init_settings, CachedEnvSettingsSource(settings_cls))
+
+    @cached_property
+    def reddit(self) -> SettingsGroup:
+        return SettingsGroup(self, "reddit")
+
+    @cached_property
+    def ollama(self) -> SettingsGroup:
+        return SettingsGroup(self, "ollama")
+
+    @cached_property
+    def tts(self) -> SettingsGroup:
+        return SettingsGroup(self, "tts")
+
+    @cached_property
+    def video(self) -> SettingsGroup:
+        return SettingsGroup(self, "video")
+
+    @cached_property
+    def caption(self) -> SettingsGroup:
+        return SettingsGroup(self, "caption")
+
+    @cached_property
     def data_dir(self) -> Path:
         return self.project_root / "data"
 
-    @property
+    @cached_property
     def videos_dir(self) -> Path:
         return self.data_dir / "videos"
 
-    @property
+    @cached_property
     def stories_dir(self) -> Path:
         return self.data_dir / "stories"
 
-    @property
+    @cached_property
     def audio_dir(self) -> Path:
         return self.data_dir / "audio"
 
-    @property
+    @cached_property
     def output_dir(self) -> Path:
         return self.data_dir / "output"
 
-    @property
+    @cached_property
     def cache_dir(self) -> Path:
         return self.data_dir / "cache"
 
-    @property
+    @cached_property
     def assets_dir(self) -> Path:
         return self.project_root / "assets"
 
-    @property
+    @cached_property
     def prompts_dir(self) -> Path:
         return self.project_root / "config" / "prompts"
 
 
-# Singleton instance
-_settings: Settings | None = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get or create the settings singleton."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """Get the settings singleton (reset with ``get_settings.cache_clear()``)."""
+    return Settings()
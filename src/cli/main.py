@@ -3,29 +3,73 @@ CLI interface for Project Sloppenhimer.
 """
 
 import sys
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
 import typer
-from loguru import logger
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-# Configure loguru
-logger.remove()
-logger.add(
-    sys.stderr,
-    format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
-    level="INFO",
-)
 
 app = typer.Typer(
     name="sloppenhimer",
     help="Automated Reddit story video generator with Minecraft gameplay.",
     add_completion=False,
 )
-console = Console()
+
+
+@cache
+def _console():
+    """Create the shared rich console on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _configure_logging() -> None:
+    """Configure loguru output for CLI commands."""
+    from loguru import logger
+
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
+        level="INFO",
+    )
+
+
+# Column specs for rich tables: (header, add_column kwargs)
+_STORY_COLUMNS = (
+    ("ID", {"style": "cyan"}),
+    ("Subreddit", {"style": "magenta"}),
+    ("Score", {"justify": "right"}),
+    ("Words", {"justify": "right"}),
+)
+_VIDEO_COLUMNS = (
+    ("ID", {"style": "cyan"}),
+    ("Duration", {"justify": "right"}),
+    ("Title", {"max_width": 50}),
+)
+_VOICE_COLUMNS = (
+    ("Voice ID", {"style": "cyan"}),
+    ("Gender", {}),
+    ("Locale", {}),
+)
+
+
+def _make_table(title: str, columns: tuple):
+    """Build a rich table from a column spec."""
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
+
+
+def __getattr__(name: str):
+    """Resolve ``console`` lazily so importing the CLI stays cheap."""
+    if name == "console":
+        return _console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @app.command()
@@ -41,6 +85,7 @@ def scrape(
     """Scrape stories from Reddit."""
     from src.scrapers import RedditScraper
 
+    console = _console()
     scraper = RedditScraper()
 
     if subreddits:
@@ -57,12 +102,9 @@ def scrape(
     console.print(f"[green]Scraped and saved {len(saved)} stories![/green]")
 
     # Show table of stories
-    table = Table(title="Scraped Stories")
-    table.add_column("ID", style="cyan")
-    table.add_column("Subreddit", style="magenta")
-    table.add_column("Score", justify="right")
-    table.add_column("Words", justify="right")
-    table.add_column("Title", max_width=40)
+    table = _make_table(
+        "Scraped Stories", _STORY_COLUMNS + (("Title", {"max_width": 40}),)
+    )
 
     for story in stories[:10]:
         table.add_row(
@@ -87,8 +129,11 @@ def fetch_videos(
     ),
 ):
     """Download Minecraft gameplay videos from YouTube."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     from src.scrapers import YouTubeDownloader
 
+    console = _console()
     downloader = YouTubeDownloader()
 
     console.print(f"[bold]Searching and downloading {count} videos...[/bold]")
@@ -120,6 +165,7 @@ def list_stories():
     """List all scraped stories."""
     from src.scrapers import RedditScraper
 
+    console = _console()
     scraper = RedditScraper()
     story_ids = scraper.list_stories()
 
@@ -127,15 +173,14 @@ def list_stories():
         console.print("[yellow]No stories found. Run 'scrape' first.[/yellow]")
         return
 
-    table = Table(title=f"Available Stories ({len(story_ids)})")
-    table.add_column("ID", style="cyan")
-    table.add_column("Subreddit", style="magenta")
-    table.add_column("Score", justify="right")
-    table.add_column("Words", justify="right")
-    table.add_column("Title", max_width=50)
+    table = _make_table(
+        f"Available Stories ({len(story_ids)})",
+        _STORY_COLUMNS + (("Title", {"max_width": 50}),),
+    )
+
+    stories = scraper.load_stories(story_ids[:20])
 
-    for story_id in story_ids[:20]:
-        story = scraper.load_story(story_id)
+    for story in stories:
         if story:
             table.add_row(
                 story.id,
@@ -156,6 +201,7 @@ def list_videos():
     """List all downloaded videos."""
     from src.scrapers import YouTubeDownloader
 
+    console = _console()
     downloader = YouTubeDownloader()
     videos = downloader.list_videos()
 
@@ -163,10 +209,7 @@ def list_videos():
         console.print("[yellow]No videos found. Run 'fetch-videos' first.[/yellow]")
         return
 
-    table = Table(title=f"Available Videos ({len(videos)})")
-    table.add_column("ID", style="cyan")
-    table.add_column("Duration", justify="right")
-    table.add_column("Title", max_width=50)
+    table = _make_table(f"Available Videos ({len(videos)})", _VIDEO_COLUMNS)
 
     for video in videos:
         table.add_row(
@@ -188,6 +231,7 @@ def process(
     """Process a story through the full pipeline."""
     from src.video import Pipeline
 
+    console = _console()
     pipeline = Pipeline()
 
     console.print(f"[bold]Processing story: {story_id}[/bold]")
@@ -207,6 +251,7 @@ def check():
     """Check system dependencies and configuration."""
     from config.settings import get_settings
 
+    console = _console()
     settings = get_settings()
 
     console.print("[bold]Checking system dependencies...[/bold]\n")
@@ -221,9 +266,8 @@ def check():
 
     # Check Ollama
     try:
-        import ollama
-        models = ollama.list()
-        model_names = [m.get("name", "") for m in models.get("models", [])]
+        from src.processors.llm import list_ollama_models
+        model_names = list_ollama_models()
         console.print(f"[green]✓[/green] Ollama: {len(model_names)} models available")
         if model_names:
             for name in model_names[:3]:
@@ -243,7 +287,7 @@ def check():
         ("Output", settings.output_dir),
     ]:
         exists = path.exists()
-        files = len(list(path.glob("*"))) if exists else 0
+        files = sum(1 for _ in path.iterdir()) if exists else 0
         status = "[green]✓[/green]" if exists else "[yellow]![/yellow]"
         console.print(f"  {status} {name}: {path} ({files} files)")
 
@@ -253,15 +297,13 @@ def voices():
     """List available TTS voices."""
     from src.processors import TTSEngine
 
+    console = _console()
     console.print("[bold]Fetching available voices...[/bold]")
 
     with console.status("Loading..."):
         voices = TTSEngine.list_voices("en")
 
-    table = Table(title=f"English TTS Voices ({len(voices)})")
-    table.add_column("Voice ID", style="cyan")
-    table.add_column("Gender")
-    table.add_column("Locale")
+    table = _make_table(f"English TTS Voices ({len(voices)})", _VOICE_COLUMNS)
 
     for voice in voices:
         table.add_row(
@@ -281,7 +323,7 @@ def main():
     Automatically creates short-form videos from Reddit stories
     with Minecraft gameplay backgrounds and TTS narration.
     """
-    pass
+    _configure_logging()
 
 
 if __name__ == "__main__":
@@ -2,12 +2,22 @@
 Data models for captions and word timing.
 """
 
+import io
+from pathlib import Path
+from typing import TextIO
+
 from pydantic import BaseModel, Field
 
+# Characters that close a caption segment
+_TERMINATORS = frozenset(".?!")
+_TERMINATORS_V2 = frozenset(".?!,")
+
 
 class WordTiming(BaseModel):
     """Timing information for a single word."""
 
+    model_config = {"frozen": True}
+
     word: str = Field(description="The word text")
     start_time: float = Field(description="Start time in seconds")
     end_time: float = Field(description="End time in seconds")
@@ -43,117 +53,93 @@ class Transcript(BaseModel):
 
     def get_segments(self, words_per_segment: int = 4) -> list[CaptionSegment]:
         """Group words into display segments."""
-        segments = []
-        for i in range(0, len(self.words), words_per_segment):
-            group = self.words[i : i + words_per_segment]
-            if group:
-                segments.append(
-                    CaptionSegment(
-                        words=group,
-                        start_time=group[0].start_time,
-                        end_time=group[-1].end_time,
-                    )
-                )
-        return segments
-    def get_segments_v2(self, words_per_segment: int = None) -> list[CaptionSegment]:
+        words = self.words
+        return [
+            _segment(words[i : i + words_per_segment])
+            for i in range(0, len(words), words_per_segment)
+        ]
+
+    def get_sentence_segments(
+        self,
+        terminators: frozenset[str] = _TERMINATORS,
+    ) -> list[CaptionSegment]:
+        """
+        Split transcript into sentence-aligned caption segments.
+        A segment ends on a word whose last character is in `terminators`
+        ('.', '?', or '!' by default).
+        """
+        words = self.words
+        boundaries = []
+        start = 0
+        for i, word in enumerate(words):
+            if _last_char(word.word) in terminators:
+                boundaries.append((start, i + 1))
+                start = i + 1
+        # Any leftover words form a final segment
+        if start < len(words):
+            boundaries.append((start, len(words)))
+
+        return [_segment(words[s:e]) for s, e in boundaries]
+
+    def get_segments_v2(self, words_per_segment: int | None = None) -> list[CaptionSegment]:
         """
         Group words into caption segments aligned with sentences.
 
         - If `words_per_segment` is provided, fallback to fixed-size segments (legacy).
-        - Otherwise, segments are split at '.', '?', or '!'.
+        - Otherwise, segments are split at '.', '?', '!', or ','.
         """
-        segments = []
         if words_per_segment:
-            # Legacy fixed-size grouping
-            for i in range(0, len(self.words), words_per_segment):
-                group = self.words[i : i + words_per_segment]
-                if group:
-                    segments.append(
-                        CaptionSegment(
-                            words=group,
-                            start_time=group[0].start_time,
-                            end_time=group[-1].end_time,
-                        )
-                    )
-            return segments
-
-        # Sentence-aware grouping
-        current: list[WordTiming] = []
-        for word in self.words:
-            current.append(word)
-
-            if word.word.rstrip().endswith((".", "?", "!",",")):
-                segments.append(
-                    CaptionSegment(
-                        words=current.copy(),
-                        start_time=current[0].start_time,
-                        end_time=current[-1].end_time,
-                    )
-                )
-                current = []
-
-        if current:
-            segments.append(
-                CaptionSegment(
-                    words=current.copy(),
-                    start_time=current[0].start_time,
-                    end_time=current[-1].end_time,
-                )
-            )
-
-        return segments
+            return self.get_segments(words_per_segment)
+        return self.get_sentence_segments(_TERMINATORS_V2)
 
     def to_srt(self) -> str:
         """Export to SRT subtitle format."""
-        segments = self.get_segments()
-        lines = []
-        for i, seg in enumerate(segments, 1):
-            start = _format_srt_time(seg.start_time)
-            end = _format_srt_time(seg.end_time)
-            lines.append(f"{i}")
-            lines.append(f"{start} --> {end}")
-            lines.append(seg.text)
-            lines.append("")
-        return "\n".join(lines)
-    def get_sentence_segments(self) -> list[CaptionSegment]:
-        """
-        Split transcript into sentence-aligned caption segments.
-        A segment ends on '.', '?', or '!'.
-        """
-        segments: list[CaptionSegment] = []
-        current: list[WordTiming] = []
-
-        for word in self.words:
-            current.append(word)
-
-            if word.word.rstrip().endswith((".", "?", "!")):
-                segments.append(
-                    CaptionSegment(
-                        words=current,
-                        start_time=current[0].start_time,
-                        end_time=current[-1].end_time,
-                    )
-                )
-                current = []
-
-        # Add any leftover words as a segment
-        if current:
-            segments.append(
-                CaptionSegment(
-                    words=current,
-                    start_time=current[0].start_time,
-                    end_time=current[-1].end_time,
-                )
+        buf = io.StringIO()
+        self._write_srt(buf)
+        return buf.getvalue()
+
+    def write_srt(self, path: Path) -> None:
+        """Write SRT subtitles directly to a file."""
+        with open(path, "w", encoding="utf-8") as f:
+            self._write_srt(f)
+
+    def _write_srt(self, out: TextIO) -> None:
+        """Write SRT cues to a text stream, separated by blank lines."""
+        for i, seg in enumerate(self.get_segments(), 1):
+            if i > 1:
+                out.write("\n")
+            out.write(
+                f"{i}\n"
+                f"{_format_srt_time(seg.start_time)} --> {_format_srt_time(seg.end_time)}\n"
+                f"{seg.text}\n"
             )
 
-        return segments
 
+def _segment(words: list[WordTiming]) -> CaptionSegment:
+    """
+    Build a segment from a non-empty run of already-validated words.
+
+    Skips pydantic validation, which would otherwise re-validate every
+    WordTiming in the run.
+    """
+    return CaptionSegment.model_construct(
+        words=words,
+        start_time=words[0].start_time,
+        end_time=words[-1].end_time,
+    )
+
+
+def _last_char(text: str) -> str:
+    """Return the last non-whitespace character of text, or "" if none."""
+    i = len(text) - 1
+    while i >= 0 and text[i].isspace():
+        i -= 1
+    return text[i] if i >= 0 else ""
 
 
 def _format_srt_time(seconds: float) -> str:
     """Format seconds as SRT timestamp (HH:MM:SS,mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
     millis = int((seconds % 1) * 1000)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
@@ -4,9 +4,10 @@ Data models for Reddit stories.
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class StoryStatus(str, Enum):
@@ -20,8 +21,27 @@ class StoryStatus(str, Enum):
     FAILED = "failed"
 
 
-class RedditStory(BaseModel):
-    """Raw Reddit story data."""
+class _CachedStatsModel(BaseModel):
+    """
+    Model whose text statistics are cached_property values.
+
+    The cache lives in the instance __dict__, which model_copy carries
+    over, so copies drop it and recompute from their own fields.
+    """
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        for cls in type(self).__mro__:
+            for name, value in vars(cls).items():
+                if isinstance(value, cached_property):
+                    copied.__dict__.pop(name, None)
+        return copied
+
+
+class RedditStory(_CachedStatsModel):
+    """Raw Reddit story data; frozen, so word_count can't go stale."""
+
+    model_config = ConfigDict(frozen=True)
 
     id: str = Field(description="Reddit post ID")
     subreddit: str = Field(description="Source subreddit")
@@ -33,7 +53,7 @@ class RedditStory(BaseModel):
     created_utc: datetime = Field(description="Post creation time")
     num_comments: int = Field(default=0, description="Number of comments")
 
-    @property
+    @cached_property
     def word_count(self) -> int:
         return len(self.body.split())
 
@@ -42,8 +62,14 @@ class RedditStory(BaseModel):
         return len(self.body)
 
 
-class ProcessedStory(BaseModel):
-    """Story after LLM processing."""
+class ProcessedStory(_CachedStatsModel):
+    """
+    Story after LLM processing.
+
+    The pipeline updates status and paths in place, so this model isn't
+    frozen; simplified_text must not be reassigned once word_count or
+    estimated_duration_seconds has been read. Use model_copy instead.
+    """
 
     original: RedditStory = Field(description="Original Reddit story")
     simplified_text: str = Field(description="LLM-processed text for TTS")
@@ -54,13 +80,11 @@ class ProcessedStory(BaseModel):
     output_video_path: Path | None = Field(default=None, description="Final video")
     error_message: str | None = Field(default=None, description="Error if failed")
 
-    @property
+    @cached_property
     def word_count(self) -> int:
         return len(self.simplified_text.split())
 
-    @property
+    @cached_property
     def estimated_duration_seconds(self) -> float:
         """Estimate audio duration at ~150 words per minute."""
         return (self.word_count / 150) * 60
-
-    model_config = {"arbitrary_types_allowed": True}
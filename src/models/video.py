@@ -31,8 +31,6 @@ class VideoMetadata(BaseModel):
     def is_vertical(self) -> bool:
         return self.height > self.width
 
-    model_config = {"arbitrary_types_allowed": True}
-
 
 class VideoSegment(BaseModel):
     """A segment of video to use in final output."""
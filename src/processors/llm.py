@@ -3,6 +3,11 @@ LLM processor using Ollama for local inference.
 Simplifies Reddit stories for TTS readability.
 """
 
+import asyncio
+import random
+import re
+import time
+from functools import lru_cache
 from pathlib import Path
 
 import ollama
@@ -11,43 +16,113 @@ from loguru import logger
 from config.settings import get_settings
 from src.models import ProcessedStory, RedditStory, StoryStatus
 
+# Stop if the model starts echoing another story section after its rewrite
+_STOP_SEQUENCES = ["\n\nORIGINAL STORY:", "\n\nSTORY:", "</s>"]
+
+# Preambles models like to put before the rewritten story
+_PREFIX_RE = re.compile(
+    r"^\s*(?:here(?:'s| is) the rewritten story:|rewritten story:|rewritten:)\s*",
+    re.IGNORECASE,
+)
+_QUOTED_RE = re.compile(r'^"(.*)"$', re.DOTALL)
+
+# Rough English average, used only to size the context window
+_CHARS_PER_TOKEN = 4
+_MIN_NUM_CTX = 2048
+
+
+# Used when config/prompts/simplify_story.txt is missing
+_FALLBACK_TEMPLATE = """Rewrite this story to be clearer and easier to read aloud.
+Keep the same plot but use simpler sentences. Remove Reddit jargon like AITA.
+Just output the rewritten story, nothing else.
+
+STORY:
+{story_text}
+
+REWRITTEN:"""
+
+
+@lru_cache(maxsize=8)
+def _load_template(path: str, mtime_ns: int) -> str:
+    """
+    Read a prompt template, shared by every LLMProcessor in the process.
+
+    The mtime is part of the cache key, so edits to the file are picked up.
+    """
+    return Path(path).read_text(encoding="utf-8")
+
+
+# How long a fetched model list stays fresh, in seconds
+_MODEL_LIST_TTL = 60
+
+
+@lru_cache(maxsize=1)
+def _list_models_cached(ttl_bucket: int) -> tuple[str, ...]:
+    """Fetch local model names; a new ttl_bucket forces a refetch."""
+    return tuple(m.model or "" for m in ollama.list().models)
+
+
+def list_ollama_models() -> tuple[str, ...]:
+    """Names of the models Ollama has locally, cached for up to a minute."""
+    return _list_models_cached(int(time.time() // _MODEL_LIST_TTL))
+
+
+# Retry backoff cap, and the circuit breaker that stops calling Ollama for
+# a cooldown after repeated failures
+_MAX_BACKOFF = 30.0
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 60.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given zero-based attempt."""
+    return min(2**attempt + random.random(), _MAX_BACKOFF)
+
+
+def _next_pow2(n: int) -> int:
+    """Smallest power of two >= n."""
+    return 1 << (max(n, 1) - 1).bit_length()
+
 
 class LLMProcessor:
     """Process stories using local Ollama LLM."""
 
+    # Shared by every processor, so one outage trips the breaker process-wide
+    _fail_streak: int = 0
+    _circuit_open_until: float = 0.0
+
     def __init__(self):
         self.settings = get_settings()
-        self._prompt_template: str | None = None
 
     @property
     def prompt_template(self) -> str:
         """Load prompt template from file."""
-        if self._prompt_template is None:
-            prompt_path = self.settings.prompts_dir / "simplify_story.txt"
-            if prompt_path.exists():
-                # Fix: Add encoding='utf-8' to handle special characters
-                self._prompt_template = prompt_path.read_text(encoding='utf-8')
-            else:
-                # Fallback template
-                self._prompt_template = """Rewrite this story to be clearer and easier to read aloud.
-Keep the same plot but use simpler sentences. Remove Reddit jargon like AITA.
-Just output the rewritten story, nothing else.
+        prompt_path = self.settings.prompts_dir / "simplify_story.txt"
+        try:
+            mtime_ns = prompt_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return _FALLBACK_TEMPLATE
+        return _load_template(str(prompt_path), mtime_ns)
 
-STORY:
-{story_text}
+    def _build_prompt(self, story_text: str) -> str:
+        """
+        Insert the story into the prompt template.
 
-REWRITTEN:"""
-        return self._prompt_template
+        The template's instructions come before the story, so every prompt
+        shares the same prefix and Ollama can reuse its cached KV state.
+        """
+        prefix, _, suffix = self.prompt_template.partition("{story_text}")
+        return prefix + story_text + suffix
 
     def check_ollama(self) -> bool:
         """Check if Ollama is available and model is loaded."""
         try:
-            models = ollama.list()
-            model_names = [m.get("name", "") for m in models.get("models", [])]
+            model_names = list_ollama_models()
             target = self.settings.ollama.model
 
-            # Check if model is available (partial match for tags)
-            available = any(target.split(":")[0] in name for name in model_names)
+            # Check if model is available (any tag of the same base model)
+            base_names = {name.split(":", 1)[0] for name in model_names}
+            available = target.split(":", 1)[0] in base_names
 
             if not available:
                 logger.warning(
@@ -60,6 +135,17 @@ REWRITTEN:"""
             logger.info("Make sure Ollama is running: ollama serve")
             return False
 
+    def preload(self) -> None:
+        """Load the model into Ollama and pin it for `keep_alive`."""
+        try:
+            ollama.generate(
+                model=self.settings.ollama.model,
+                prompt="",
+                keep_alive=self.settings.ollama.keep_alive,
+            )
+        except Exception as e:
+            logger.warning(f"Could not preload {self.settings.ollama.model}: {e}")
+
     def simplify_story(
         self,
         story: RedditStory,
@@ -75,7 +161,10 @@ REWRITTEN:"""
         Returns:
             ProcessedStory with simplified text
         """
-        prompt = self.prompt_template.format(story_text=story.body)
+        request = self._build_request(story)
+
+        if self._circuit_open():
+            return self._fallback(story, RuntimeError("Ollama circuit breaker is open"))
 
         for attempt in range(max_retries + 1):
             try:
@@ -83,47 +172,73 @@ REWRITTEN:"""
                     f"Simplifying story {story.id} "
                     f"({story.word_count} words) with {self.settings.ollama.model}"
                 )
+                response = ollama.generate(**request)
+                processed = self._to_processed(story, response)
+                self._record_success()
+                return processed
 
-                response = ollama.generate(
-                    model=self.settings.ollama.model,
-                    prompt=prompt,
-                    options={
-                        "temperature": 0.7,
-                        "top_p": 0.9,
-                        "num_predict": story.word_count * 2,  # Allow some expansion
-                    },
+            except Exception as e:
+                self._record_failure()
+                if attempt == max_retries or self._circuit_open():
+                    logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                    return self._fallback(story, e)
+                delay = _backoff_delay(attempt)
+                logger.warning(
+                    f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.1f}s..."
                 )
+                time.sleep(delay)
 
-                simplified = response.get("response", "").strip()
+        # Should never reach here
+        return ProcessedStory(
+            original=story,
+            simplified_text=story.body,
+            status=StoryStatus.FAILED,
+        )
 
-                if not simplified:
-                    raise ValueError("Empty response from LLM")
+    async def simplify_story_async(
+        self,
+        story: RedditStory,
+        max_retries: int = 2,
+        client: ollama.AsyncClient | None = None,
+    ) -> ProcessedStory:
+        """
+        Simplify a Reddit story for TTS asynchronously.
 
-                # Clean up common LLM artifacts
-                simplified = self._clean_response(simplified)
+        Args:
+            story: The original Reddit story
+            max_retries: Number of retries on failure
+            client: Ollama async client to reuse (created if omitted)
 
-                logger.info(
-                    f"Simplified story: {story.word_count} -> "
-                    f"{len(simplified.split())} words"
-                )
+        Returns:
+            ProcessedStory with simplified text
+        """
+        client = client or self._async_client()
+        request = self._build_request(story)
+
+        if self._circuit_open():
+            return self._fallback(story, RuntimeError("Ollama circuit breaker is open"))
 
-                return ProcessedStory(
-                    original=story,
-                    simplified_text=simplified,
-                    status=StoryStatus.SIMPLIFIED,
+        for attempt in range(max_retries + 1):
+            try:
+                logger.info(
+                    f"Simplifying story {story.id} "
+                    f"({story.word_count} words) with {self.settings.ollama.model}"
                 )
+                response = await client.generate(**request)
+                processed = self._to_processed(story, response)
+                self._record_success()
+                return processed
 
             except Exception as e:
-                logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                if attempt == max_retries:
-                    logger.error(f"Failed to simplify story {story.id}")
-                    # Return original text as fallback
-                    return ProcessedStory(
-                        original=story,
-                        simplified_text=story.body,
-                        status=StoryStatus.SIMPLIFIED,
-                        error_message=f"LLM failed, using original: {e}",
-                    )
+                self._record_failure()
+                if attempt == max_retries or self._circuit_open():
+                    logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                    return self._fallback(story, e)
+                delay = _backoff_delay(attempt)
+                logger.warning(
+                    f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
 
         # Should never reach here
         return ProcessedStory(
@@ -132,34 +247,123 @@ REWRITTEN:"""
             status=StoryStatus.FAILED,
         )
 
+    @classmethod
+    def _circuit_open(cls) -> bool:
+        """True while the breaker is cooling down after repeated failures."""
+        return time.monotonic() < cls._circuit_open_until
+
+    @classmethod
+    def _record_success(cls) -> None:
+        cls._fail_streak = 0
+
+    @classmethod
+    def _record_failure(cls) -> None:
+        cls._fail_streak += 1
+        if cls._fail_streak >= _BREAKER_THRESHOLD and not cls._circuit_open():
+            cls._circuit_open_until = time.monotonic() + _BREAKER_COOLDOWN
+            logger.error(
+                f"Ollama failed {cls._fail_streak} times in a row; "
+                f"skipping LLM calls for {_BREAKER_COOLDOWN:.0f}s"
+            )
+
+    def _async_client(self) -> ollama.AsyncClient:
+        """Create an async Ollama client for the configured host."""
+        return ollama.AsyncClient(
+            host=self.settings.ollama.host,
+            timeout=self.settings.ollama.timeout,
+        )
+
+    def _build_request(self, story: RedditStory) -> dict:
+        """Build the Ollama generate() arguments for a story."""
+        prompt = self._build_prompt(story.body)
+
+        # Rewrites stay close to the original length (~1.3 tokens per word),
+        # so leave some headroom without letting generation run away
+        num_predict = min(
+            int(story.word_count * 1.6) + 64,
+            self.settings.ollama.max_tokens,
+        )
+        # Size the KV cache to the actual workload
+        prompt_tokens = len(prompt) // _CHARS_PER_TOKEN
+        num_ctx = max(_MIN_NUM_CTX, _next_pow2(prompt_tokens + num_predict))
+
+        return {
+            "model": self.settings.ollama.model,
+            "prompt": prompt,
+            "keep_alive": self.settings.ollama.keep_alive,
+            "options": {
+                "temperature": 0.7,
+                "top_p": 0.9,
+                "num_predict": num_predict,
+                "num_ctx": num_ctx,
+                "stop": _STOP_SEQUENCES,
+            },
+        }
+
+    def _to_processed(self, story: RedditStory, response) -> ProcessedStory:
+        """Turn an Ollama response into a ProcessedStory."""
+        simplified = response.get("response", "").strip()
+
+        if not simplified:
+            raise ValueError("Empty response from LLM")
+
+        # Clean up common LLM artifacts
+        simplified = self._clean_response(simplified)
+
+        logger.info(
+            f"Simplified story: {story.word_count} -> "
+            f"{len(simplified.split())} words"
+        )
+
+        return ProcessedStory(
+            original=story,
+            simplified_text=simplified,
+            status=StoryStatus.SIMPLIFIED,
+        )
+
+    def _fallback(self, story: RedditStory, error: Exception) -> ProcessedStory:
+        """Keep the original text when the LLM could not simplify it."""
+        logger.error(f"Failed to simplify story {story.id}")
+        return ProcessedStory(
+            original=story,
+            simplified_text=story.body,
+            status=StoryStatus.SIMPLIFIED,
+            error_message=f"LLM failed, using original: {error}",
+        )
+
     def _clean_response(self, text: str) -> str:
         """Clean up common LLM response artifacts."""
         # Remove common prefixes
-        prefixes_to_remove = [
-            "Here's the rewritten story:",
-            "Here is the rewritten story:",
-            "REWRITTEN STORY:",
-            "Rewritten story:",
-            "REWRITTEN:",
-        ]
-        for prefix in prefixes_to_remove:
-            if text.lower().startswith(prefix.lower()):
-                text = text[len(prefix) :].strip()
+        text = _PREFIX_RE.sub("", text, count=1)
 
         # Remove quotes if entire text is quoted
-        if text.startswith('"') and text.endswith('"'):
-            text = text[1:-1]
+        match = _QUOTED_RE.match(text)
+        if match:
+            text = match.group(1)
 
         return text.strip()
 
+    async def process_batch_async(
+        self,
+        stories: list[RedditStory],
+    ) -> list[ProcessedStory]:
+        """Process multiple stories with bounded concurrency."""
+        client = self._async_client()
+        semaphore = asyncio.Semaphore(max(1, self.settings.ollama.parallel))
+
+        async def bounded(i: int, story: RedditStory) -> ProcessedStory:
+            async with semaphore:
+                logger.info(f"Processing story {i + 1}/{len(stories)}: {story.id}")
+                return await self.simplify_story_async(story, client=client)
+
+        return list(
+            await asyncio.gather(*(bounded(i, s) for i, s in enumerate(stories)))
+        )
+
     def process_batch(
         self,
         stories: list[RedditStory],
     ) -> list[ProcessedStory]:
         """Process multiple stories."""
-        results = []
-        for i, story in enumerate(stories):
-            logger.info(f"Processing story {i + 1}/{len(stories)}: {story.id}")
-            result = self.simplify_story(story)
-            results.append(result)
-        return results
\ No newline at end of file
+        self.preload()
+        return asyncio.run(self.process_batch_async(stories))
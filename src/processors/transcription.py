@@ -1,40 +1,95 @@
 """
-Transcription processor using OpenAI Whisper.
+Transcription processor using faster-whisper (CTranslate2).
 Generates word-level timestamps for caption synchronization.
 """
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-import whisper
+import ctranslate2
+import numpy as np
+import orjson
+from faster_whisper import WhisperModel
 from loguru import logger
 
 from config.settings import get_settings
 from src.models import Transcript, WordTiming
+from src.utils.paths import save_json
+
+# Silero VAD settings: drop non-speech spans (such as the title/body pause)
+# before decoding
+VAD_PARAMETERS = {"min_silence_duration_ms": 500, "threshold": 0.5}
+
+
+@lru_cache(maxsize=4)
+def _load_whisper(
+    model_size: str,
+    device: str,
+    compute_type: str,
+    num_workers: int = 1,
+) -> WhisperModel:
+    """Load a Whisper model once per process for each configuration."""
+    logger.info(f"Loading Whisper model: {model_size} ({device}, {compute_type})")
+    # Split CPU threads between workers so concurrent decodes don't oversubscribe
+    model = WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=max(1, (os.cpu_count() or 1) // num_workers),
+        num_workers=num_workers,
+    )
+    logger.info("Whisper model loaded")
+    return model
 
 
 class TranscriptionProcessor:
     """Generate word-level transcriptions from audio using Whisper."""
 
-    def __init__(self, model_size: str = "base"):
+    def __init__(
+        self,
+        model_size: str = "base",
+        compute_type: str | None = None,
+        vad_filter: bool = True,
+        num_workers: int = 2,
+    ):
         """
         Initialize transcription processor.
 
         Args:
-            model_size: Whisper model size (tiny, base, small, medium, large)
+            model_size: Whisper model size (tiny, base, small, medium, large-v3)
+            compute_type: CTranslate2 compute type (defaults to int8_float16
+                on CUDA, int8 on CPU)
+            vad_filter: Skip non-speech audio with voice activity detection
+            num_workers: Concurrent decodes allowed by transcribe_batch
         """
         self.settings = get_settings()
         self.model_size = model_size
-        self._model = None
+        self.vad_filter = vad_filter
+        self.num_workers = max(1, num_workers)
+        self.device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        self.compute_type = compute_type or (
+            "int8_float16" if self.device == "cuda" else "int8"
+        )
 
     @property
-    def model(self):
-        """Lazy-load Whisper model."""
-        if self._model is None:
-            logger.info(f"Loading Whisper model: {self.model_size}")
-            self._model = whisper.load_model(self.model_size)
-            logger.info("Whisper model loaded")
-        return self._model
+    def model(self) -> WhisperModel:
+        """Lazy-load Whisper model (shared across processor instances)."""
+        return _load_whisper(
+            self.model_size, self.device, self.compute_type, self.num_workers
+        )
+
+    @classmethod
+    def preload(
+        cls,
+        model_size: str = "base",
+        compute_type: str | None = None,
+    ) -> "TranscriptionProcessor":
+        """Create a processor and load its model up front."""
+        processor = cls(model_size, compute_type)
+        processor.model
+        return processor
 
     def transcribe(
         self,
@@ -54,33 +109,12 @@ class TranscriptionProcessor:
         audio_path = Path(audio_path)
         logger.info(f"Transcribing: {audio_path}")
 
-        # Transcribe with word timestamps
-        result = self.model.transcribe(
-            str(audio_path),
-            language=language,
-            word_timestamps=True,
-            verbose=False,
-        )
-
-        # Extract word timings
-        words = []
-        for segment in result.get("segments", []):
-            for word_info in segment.get("words", []):
-                words.append(
-                    WordTiming(
-                        word=word_info["word"].strip(),
-                        start_time=word_info["start"],
-                        end_time=word_info["end"],
-                        confidence=word_info.get("probability", 1.0),
-                    )
-                )
+        words, duration = self._transcribe_words(audio_path, language, self.vad_filter)
 
-        # Get total duration
-        duration = 0.0
-        if words:
-            duration = words[-1].end_time
-        elif result.get("segments"):
-            duration = result["segments"][-1]["end"]
+        if not words and self.vad_filter:
+            # VAD found no speech; decode the full audio so captions aren't empty
+            logger.warning("VAD removed all audio, retrying without VAD filter")
+            words, duration = self._transcribe_words(audio_path, language, False)
 
         transcript = Transcript(
             words=words,
@@ -93,6 +127,70 @@ class TranscriptionProcessor:
         )
         return transcript
 
+    def transcribe_batch(
+        self,
+        audio_paths: list[Path],
+        language: str = "en",
+    ) -> list[Transcript]:
+        """
+        Transcribe several audio files concurrently.
+
+        CTranslate2 releases the GIL while decoding, so files are spread
+        over a thread pool sized by `num_workers`.
+
+        Args:
+            audio_paths: Paths to audio files
+            language: Language code
+
+        Returns:
+            Transcripts in the same order as `audio_paths`
+        """
+        if not audio_paths:
+            return []
+
+        # Load the model once before fanning out
+        self.model
+        workers = min(len(audio_paths), self.num_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda path: self.transcribe(path, language), audio_paths)
+            )
+
+    def _transcribe_words(
+        self,
+        audio_path: Path,
+        language: str,
+        vad_filter: bool,
+    ) -> tuple[list[WordTiming], float]:
+        """Run Whisper and return (word timings, audio duration)."""
+        # Greedy decoding, as openai-whisper's transcribe did by default.
+        # Not conditioning on the previous window avoids repetition loops
+        # that burn extra decode steps.
+        segments, info = self.model.transcribe(
+            str(audio_path),
+            language=language,
+            word_timestamps=True,
+            beam_size=1,
+            condition_on_previous_text=False,
+            vad_filter=vad_filter,
+            vad_parameters=VAD_PARAMETERS if vad_filter else None,
+        )
+
+        # Extract word timings (segments are decoded lazily as we iterate)
+        words = []
+        for segment in segments:
+            for word_info in segment.words or []:
+                words.append(
+                    WordTiming(
+                        word=word_info.word.strip(),
+                        start_time=word_info.start,
+                        end_time=word_info.end,
+                        confidence=word_info.probability,
+                    )
+                )
+
+        return words, info.duration
+
     def transcribe_and_save(
         self,
         audio_path: Path,
@@ -116,14 +214,11 @@ class TranscriptionProcessor:
             output_path = audio_path.with_suffix(".json")
 
         # Save transcript
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(transcript.model_dump(), f, indent=2)
+        save_json(output_path, transcript.model_dump(mode="json"))
 
         # Also save SRT for convenience
         srt_path = audio_path.with_suffix(".srt")
-        with open(srt_path, "w", encoding="utf-8") as f:
-            f.write(transcript.to_srt())
+        transcript.write_srt(srt_path)
 
         logger.info(f"Saved transcript to {output_path}")
         logger.info(f"Saved SRT to {srt_path}")
@@ -133,9 +228,14 @@ class TranscriptionProcessor:
     @staticmethod
     def load_transcript(path: Path) -> Transcript:
         """Load transcript from JSON file."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return Transcript(**data)
+        data = orjson.loads(Path(path).read_bytes())
+        # Written by transcribe_and_save, so skip per-word validation
+        words = [WordTiming.model_construct(**w) for w in data["words"]]
+        return Transcript.model_construct(
+            words=words,
+            duration=data["duration"],
+            language=data.get("language", "en"),
+        )
 
 
 def estimate_word_timings(
@@ -161,21 +261,21 @@ def estimate_word_timings(
     # Calculate time per word based on actual duration
     time_per_word = audio_duration / len(words)
 
-    word_timings = []
-    current_time = 0.0
+    starts = np.arange(len(words), dtype=np.float64) * time_per_word
+    ends = starts + time_per_word
 
-    for word in words:
-        word_timings.append(
-            WordTiming(
-                word=word,
-                start_time=current_time,
-                end_time=current_time + time_per_word,
-                confidence=0.5,  # Lower confidence for estimates
-            )
+    # Inputs are generated here, so skip pydantic validation
+    word_timings = [
+        WordTiming.model_construct(
+            word=word,
+            start_time=start,
+            end_time=end,
+            confidence=0.5,  # Lower confidence for estimates
         )
-        current_time += time_per_word
+        for word, start, end in zip(words, starts.tolist(), ends.tolist())
+    ]
 
-    return Transcript(
+    return Transcript.model_construct(
         words=word_timings,
         duration=audio_duration,
         language="en",
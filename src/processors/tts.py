@@ -4,20 +4,63 @@ Generates audio from simplified story text.
 """
 
 import asyncio
+import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 import edge_tts
 from loguru import logger
-from pydub import AudioSegment
 
 from config.settings import get_settings
 
+# Edge TTS streams constant-bitrate MP3 (audio-24khz-48kbitrate-mono-mp3)
+_MP3_BYTES_PER_SECOND = 48_000 // 8
+
+# Edge TTS offsets and durations are in 100ns ticks
+_TICKS_PER_SECOND = 10_000_000
+
+
+@lru_cache(maxsize=8)
+def _silence_mp3(duration: float) -> bytes:
+    """
+    Encode silence as raw MP3 frames matching edge-tts output.
+
+    No ID3 tag or Xing header is written, so the bytes can be spliced
+    between two edge-tts streams.
+    """
+    result = subprocess.run(
+        [
+            "ffmpeg", "-v", "error",
+            "-f", "lavfi", "-i", "anullsrc=r=24000:cl=mono",
+            "-t", str(duration),
+            "-c:a", "libmp3lame", "-b:a", "48k",
+            "-write_xing", "0", "-id3v2_version", "0",
+            "-f", "mp3", "pipe:1",
+        ],
+        capture_output=True,
+        check=True,
+    )
+    return result.stdout
+
 
 class TTSEngine:
     """Generate speech audio from text using edge-tts."""
 
     def __init__(self):
         self.settings = get_settings()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _run(self, coro):
+        """Run a coroutine on this engine's long-lived event loop."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        """Close the engine's event loop."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.close()
+        self._loop = None
 
     async def generate_audio_async(
         self,
@@ -72,8 +115,55 @@ class TTSEngine:
         Returns:
             Path to generated audio file
         """
-        return asyncio.run(
-            self.generate_audio_async(text, output_path, voice, rate)
+        return self._run(self.generate_audio_async(text, output_path, voice, rate))
+
+    async def _collect_mp3(
+        self,
+        text: str,
+        voice: str | None = None,
+        rate: str | None = None,
+    ) -> tuple[bytes, float]:
+        """
+        Stream synthesized speech into memory.
+
+        Returns:
+            Tuple of (mp3_bytes, spoken_duration_seconds)
+        """
+        voice = voice or self.settings.tts.edge_voice
+        rate = rate or self.settings.tts.speech_rate
+
+        audio = bytearray()
+        spoken_end = 0
+
+        communicate = edge_tts.Communicate(
+            text, voice, rate=rate, boundary="WordBoundary"
+        )
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                audio += chunk["data"]
+            elif chunk["type"] == "WordBoundary":
+                spoken_end = chunk["offset"] + chunk["duration"]
+
+        # The last word boundary marks the end of speech, before the trailing
+        # silence; the byte length (exact for constant-bitrate output) covers
+        # a stream that reported no boundaries
+        if spoken_end:
+            duration = spoken_end / _TICKS_PER_SECOND
+        else:
+            duration = len(audio) / _MP3_BYTES_PER_SECOND
+        return bytes(audio), duration
+
+    async def _collect_both_async(
+        self,
+        title: str,
+        body: str,
+        voice: str | None,
+        rate: str | None,
+    ) -> list[tuple[bytes, float]]:
+        """Synthesize title and body in parallel; both are network-bound."""
+        return await asyncio.gather(
+            self._collect_mp3(title, voice, rate),
+            self._collect_mp3(body, voice, rate),
         )
 
     def generate_title_and_body_audio(
@@ -100,42 +190,24 @@ class TTSEngine:
             Tuple of (audio_path, title_duration_seconds)
         """
         output_path = Path(output_path)
-        cache_dir = output_path.parent / "temp"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Generate title audio
-        title_path = cache_dir / f"{output_path.stem}_title.mp3"
-        self.generate_audio(title, title_path, voice, rate)
-        
-        # Generate body audio
-        body_path = cache_dir / f"{output_path.stem}_body.mp3"
-        self.generate_audio(body, body_path, voice, rate)
-        
-        # Load audio segments
-        title_audio = AudioSegment.from_mp3(str(title_path))
-        body_audio = AudioSegment.from_mp3(str(body_path))
-        
-        # Get title duration
-        title_duration = len(title_audio) / 1000.0  # Convert ms to seconds
-        
-        # Create pause
-        pause = AudioSegment.silent(duration=int(pause_duration * 1000))
-        
-        # Combine: title + pause + body
-        combined = title_audio + pause + body_audio
-        
-        # Export combined audio
-        combined.export(str(output_path), format="mp3")
-        
-        # Cleanup temp files
-        title_path.unlink()
-        body_path.unlink()
-        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Synthesize title and body concurrently, straight into memory
+        (title_audio, title_duration), (body_audio, _) = self._run(
+            self._collect_both_async(title, body, voice, rate)
+        )
+
+        # Combine: title + pause + body as one run of MP3 frames
+        with open(output_path, "wb") as f:
+            f.write(title_audio)
+            f.write(_silence_mp3(pause_duration))
+            f.write(body_audio)
+
         logger.info(
             f"Generated combined audio: title={title_duration:.2f}s, "
-            f"pause={pause_duration}s, total={len(combined)/1000:.2f}s"
+            f"pause={pause_duration}s"
         )
-        
+
         return output_path, title_duration
 
     async def generate_with_timestamps_async(
@@ -162,7 +234,10 @@ class TTSEngine:
 
         word_boundaries = []
 
-        communicate = edge_tts.Communicate(text, voice, rate=rate)
+        # edge-tts only emits sentence boundaries unless asked for words
+        communicate = edge_tts.Communicate(
+            text, voice, rate=rate, boundary="WordBoundary"
+        )
 
         with open(output_path, "wb") as f:
             async for chunk in communicate.stream():
@@ -171,8 +246,8 @@ class TTSEngine:
                 elif chunk["type"] == "WordBoundary":
                     word_boundaries.append({
                         "text": chunk["text"],
-                        "offset": chunk["offset"] / 10_000_000,  # Convert to seconds
-                        "duration": chunk["duration"] / 10_000_000,
+                        "offset": chunk["offset"] / _TICKS_PER_SECOND,
+                        "duration": chunk["duration"] / _TICKS_PER_SECOND,
                     })
 
         logger.info(f"Generated audio with {len(word_boundaries)} word boundaries")
@@ -186,7 +261,7 @@ class TTSEngine:
         rate: str | None = None,
     ) -> tuple[Path, list[dict]]:
         """Synchronous wrapper for generate_with_timestamps_async."""
-        return asyncio.run(
+        return self._run(
             self.generate_with_timestamps_async(text, output_path, voice, rate)
         )
 
@@ -3,17 +3,35 @@ Reddit scraper using YARS (Yet Another Reddit Scraper).
 No API keys required - scrapes directly from Reddit.
 """
 
-import json
+import asyncio
+import importlib.util
+import os
 import re
 import hashlib
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import httpx
+import orjson
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 
 from config.settings import get_settings
 from src.models import RedditStory
+from src.utils.paths import save_json
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# httpx only speaks HTTP/2 with the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Rate limits and transient server errors, retried by the sync and async clients
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
 
 
 class YARS:
@@ -25,61 +43,183 @@ class YARS:
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            "User-Agent": USER_AGENT,
+            # Every encoding urllib3 can decode here (adds br/zstd when installed)
+            "Accept-Encoding": ACCEPT_ENCODING,
         })
 
-    def fetch_subreddit_posts(
+        # Keep enough pooled connections for parallel subreddit scrapes, and
+        # retry transient errors and rate limits on the same connection pool
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=_RETRY_STATUSES,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def iter_subreddit_posts(
         self,
         subreddit: str,
         limit: int = 25,
         category: str = "top",
         time_filter: str = "week",
-    ) -> list[dict]:
+    ) -> Iterator[dict]:
         """
-        Fetch posts from a subreddit.
+        Yield posts from a subreddit, fetching pages only as they are consumed.
 
         Args:
             subreddit: Subreddit name (without r/)
-            limit: Number of posts to fetch
+            limit: Maximum number of posts to yield
             category: Sort category (hot, new, top, rising)
             time_filter: Time filter for top (hour, day, week, month, year, all)
 
-        Returns:
-            List of post dictionaries
+        Yields:
+            Post dictionaries
         """
         base_url = f"https://www.reddit.com/r/{subreddit}/{category}.json"
         params = {"limit": min(limit, 100), "t": time_filter}
 
-        posts = []
+        count = 0
         after = None
 
-        while len(posts) < limit:
+        while count < limit:
             if after:
                 params["after"] = after
 
             try:
                 response = self.session.get(base_url, params=params, timeout=30)
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
             except Exception as e:
                 logger.error(f"Failed to fetch r/{subreddit}: {e}")
-                break
+                return
 
             children = data.get("data", {}).get("children", [])
             if not children:
-                break
+                return
 
             for child in children:
-                post_data = child.get("data", {})
-                posts.append(post_data)
-                if len(posts) >= limit:
-                    break
+                yield child.get("data", {})
+                count += 1
+                if count >= limit:
+                    return
 
             after = data.get("data", {}).get("after")
             if not after:
+                return
+
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Create an async client for concurrent listing fetches.
+
+        With HTTP/2 every request to www.reddit.com shares one multiplexed
+        connection, so only one TLS handshake is paid however many
+        subreddits are fetched at once.
+        """
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            retries=3,
+            limits=httpx.Limits(max_connections=64),
+        )
+        return httpx.AsyncClient(
+            transport=transport,
+            headers={"User-Agent": USER_AGENT},
+            timeout=30,
+        )
+
+    async def _get_json_async(
+        self, client: httpx.AsyncClient, url: str, params: dict
+    ) -> dict:
+        """GET a JSON document, backing off on rate limits and server errors."""
+        for attempt in range(4):
+            response = await client.get(url, params=params)
+            if response.status_code not in _RETRY_STATUSES or attempt == 3:
                 break
+            await asyncio.sleep(0.3 * 2 ** attempt)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def iter_subreddit_posts_async(
+        self,
+        client: httpx.AsyncClient,
+        subreddit: str,
+        limit: int = 25,
+        category: str = "top",
+        time_filter: str = "week",
+    ) -> AsyncIterator[dict]:
+        """Async version of iter_subreddit_posts using a shared httpx client."""
+        base_url = f"https://www.reddit.com/r/{subreddit}/{category}.json"
+        params = {"limit": min(limit, 100), "t": time_filter}
+
+        count = 0
+        after = None
+
+        while count < limit:
+            if after:
+                params["after"] = after
+
+            try:
+                data = await self._get_json_async(client, base_url, params)
+            except Exception as e:
+                logger.error(f"Failed to fetch r/{subreddit}: {e}")
+                return
+
+            children = data.get("data", {}).get("children", [])
+            if not children:
+                return
+
+            for child in children:
+                yield child.get("data", {})
+                count += 1
+                if count >= limit:
+                    return
+
+            after = data.get("data", {}).get("after")
+            if not after:
+                return
+
+    async def fetch_subreddit_posts_async(
+        self,
+        client: httpx.AsyncClient,
+        subreddit: str,
+        limit: int = 25,
+        category: str = "top",
+        time_filter: str = "week",
+    ) -> list[dict]:
+        """Async version of fetch_subreddit_posts using a shared httpx client."""
+        return [
+            post
+            async for post in self.iter_subreddit_posts_async(
+                client, subreddit, limit, category, time_filter
+            )
+        ]
+
+    def fetch_subreddit_posts(
+        self,
+        subreddit: str,
+        limit: int = 25,
+        category: str = "top",
+        time_filter: str = "week",
+    ) -> list[dict]:
+        """
+        Fetch posts from a subreddit.
+
+        Args:
+            subreddit: Subreddit name (without r/)
+            limit: Number of posts to fetch
+            category: Sort category (hot, new, top, rising)
+            time_filter: Time filter for top (hour, day, week, month, year, all)
 
-        return posts
+        Returns:
+            List of post dictionaries
+        """
+        return list(self.iter_subreddit_posts(subreddit, limit, category, time_filter))
 
     def scrape_post_details(self, permalink: str) -> dict | None:
         """
@@ -99,7 +239,7 @@ class YARS:
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data and len(data) > 0:
                 return data[0].get("data", {}).get("children", [{}])[0].get("data", {})
@@ -124,10 +264,23 @@ class RedditScraper:
             logger.info("YARS Reddit scraper initialized (no API key required)")
         return self._client
 
-    def _post_to_story(self, post: dict) -> RedditStory | None:
-        """Convert YARS post dict to RedditStory model."""
+    def _post_to_story(
+        self,
+        post: dict,
+        min_length: int | None = None,
+        max_length: int | None = None,
+        min_score: int | None = None,
+    ) -> RedditStory | None:
+        """
+        Convert YARS post dict to RedditStory model.
+
+        Thresholds default to the reddit settings; scrape_subreddit passes
+        them in so they are looked up once per listing, not once per post.
+        """
+        get = post.get
+
         # Get selftext (body content)
-        selftext = post.get("selftext", "")
+        selftext = get("selftext", "")
 
         # Skip if no selftext or removed/deleted
         if not selftext or selftext in ("[removed]", "[deleted]"):
@@ -135,39 +288,44 @@ class RedditScraper:
 
         # Skip if too short or too long
         text_len = len(selftext)
-        if text_len < self.settings.reddit.min_length:
-            return None
-        if text_len > self.settings.reddit.max_length:
+        if min_length is None:
+            min_length = self.settings.reddit.min_length
+        if max_length is None:
+            max_length = self.settings.reddit.max_length
+        if text_len < min_length or text_len > max_length:
             return None
 
         # Skip if score too low
-        score = post.get("score", 0)
-        if score < self.settings.reddit.min_score:
+        score = get("score", 0)
+        if min_score is None:
+            min_score = self.settings.reddit.min_score
+        if score < min_score:
             return None
 
         # Generate ID from permalink if not available
-        post_id = post.get("id", "")
+        post_id = get("id", "")
         if not post_id:
-            permalink = post.get("permalink", "")
-            post_id = hashlib.md5(permalink.encode()).hexdigest()[:12]
+            permalink = get("permalink", "")
+            post_id = hashlib.blake2b(permalink.encode(), digest_size=6).hexdigest()
 
         # Parse created time
-        created_utc = post.get("created_utc", 0)
+        created_utc = get("created_utc", 0)
         if isinstance(created_utc, (int, float)):
             created_time = datetime.fromtimestamp(created_utc)
         else:
             created_time = datetime.now()
 
-        return RedditStory(
+        # Fields come straight from Reddit's typed JSON; skip revalidation
+        return RedditStory.model_construct(
             id=post_id,
-            subreddit=post.get("subreddit", "unknown"),
-            title=post.get("title", "Untitled"),
+            subreddit=get("subreddit", "unknown"),
+            title=get("title", "Untitled"),
             body=selftext,
-            author=post.get("author", "[deleted]"),
+            author=get("author", "[deleted]"),
             score=score,
-            url=f"https://reddit.com{post.get('permalink', '')}",
+            url=f"https://reddit.com{get('permalink', '')}",
             created_utc=created_time,
-            num_comments=post.get("num_comments", 0),
+            num_comments=get("num_comments", 0),
         )
 
     def scrape_subreddit(
@@ -194,17 +352,24 @@ class RedditScraper:
 
         logger.info(f"Scraping r/{subreddit_name} ({category} {time_filter}, limit={limit})")
 
-        # Fetch more than needed since we'll filter
-        posts = self.client.fetch_subreddit_posts(
+        # Allow up to 3x the posts needed since we'll filter, but only
+        # fetch further pages while we're still short of `limit`
+        posts = self.client.iter_subreddit_posts(
             subreddit_name,
             limit=limit * 3,
             category=category,
             time_filter=time_filter,
         )
 
+        reddit = self.settings.reddit
+        min_length, max_length, min_score = (
+            reddit.min_length, reddit.max_length, reddit.min_score
+        )
+
+        to_story = self._post_to_story
         stories = []
         for post in posts:
-            story = self._post_to_story(post)
+            story = to_story(post, min_length, max_length, min_score)
             if story:
                 stories.append(story)
                 if len(stories) >= limit:
@@ -213,17 +378,68 @@ class RedditScraper:
         logger.info(f"Found {len(stories)} valid stories from r/{subreddit_name}")
         return stories
 
-    def scrape_all(self, time_filter: str = "week") -> list[RedditStory]:
-        """Scrape stories from all configured subreddits."""
-        all_stories = []
-        for sub in self.settings.reddit.subreddits:
+    async def scrape_subreddit_async(
+        self,
+        http: httpx.AsyncClient,
+        subreddit_name: str,
+        limit: int | None = None,
+        time_filter: str = "week",
+        category: str = "top",
+    ) -> list[RedditStory]:
+        """Async version of scrape_subreddit using a shared httpx client."""
+        if limit is None:
+            limit = self.settings.reddit.posts_per_subreddit
+
+        logger.info(f"Scraping r/{subreddit_name} ({category} {time_filter}, limit={limit})")
+
+        posts = self.client.iter_subreddit_posts_async(
+            http,
+            subreddit_name,
+            limit=limit * 3,
+            category=category,
+            time_filter=time_filter,
+        )
+
+        reddit = self.settings.reddit
+        min_length, max_length, min_score = (
+            reddit.min_length, reddit.max_length, reddit.min_score
+        )
+
+        to_story = self._post_to_story
+        stories = []
+        async for post in posts:
+            story = to_story(post, min_length, max_length, min_score)
+            if story:
+                stories.append(story)
+                if len(stories) >= limit:
+                    break
+        await posts.aclose()
+
+        logger.info(f"Found {len(stories)} valid stories from r/{subreddit_name}")
+        return stories
+
+    async def _scrape_all_async(self, time_filter: str) -> list[RedditStory]:
+        """Fetch every configured subreddit concurrently over one client."""
+        subreddits = self.settings.reddit.subreddits
+
+        async def scrape(http: httpx.AsyncClient, sub: str) -> list[RedditStory]:
             try:
-                stories = self.scrape_subreddit(sub, time_filter=time_filter)
-                all_stories.extend(stories)
+                return await self.scrape_subreddit_async(http, sub, time_filter=time_filter)
             except Exception as e:
                 logger.error(f"Failed to scrape r/{sub}: {e}")
-                continue
-        return all_stories
+                return []
+
+        async with self.client.async_client() as http:
+            # gather() keeps the configured subreddit order
+            results = await asyncio.gather(*(scrape(http, sub) for sub in subreddits))
+
+        return [story for stories in results for story in stories]
+
+    def scrape_all(self, time_filter: str = "week") -> list[RedditStory]:
+        """Scrape stories from all configured subreddits concurrently."""
+        if not self.settings.reddit.subreddits:
+            return []
+        return asyncio.run(self._scrape_all_async(time_filter))
 
     def save_stories(self, stories: list[RedditStory]) -> list[Path]:
         """Save stories to individual JSON files."""
@@ -233,8 +449,7 @@ class RedditScraper:
 
         for story in stories:
             path = stories_dir / f"{story.id}.json"
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(story.model_dump(), f, indent=2, default=str)
+            save_json(path, story.model_dump(mode="json"))
             saved_paths.append(path)
             logger.debug(f"Saved story {story.id} to {path}")
 
@@ -244,15 +459,33 @@ class RedditScraper:
     def load_story(self, story_id: str) -> RedditStory | None:
         """Load a story from disk by ID."""
         path = self.settings.stories_dir / f"{story_id}.json"
-        if not path.exists():
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
             return None
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return RedditStory(**data)
+        # pydantic-core parses straight into the model, no intermediate dict
+        return RedditStory.model_validate_json(data)
+
+    def load_stories(self, story_ids: list[str]) -> list[RedditStory | None]:
+        """Load several stories concurrently, in the order given."""
+        if not story_ids:
+            return []
+        # Each load is an independent small file read
+        with ThreadPoolExecutor(max_workers=min(8, len(story_ids))) as pool:
+            return list(pool.map(self.load_story, story_ids))
+
+    def iter_story_ids(self) -> Iterator[str]:
+        """Yield saved story IDs lazily from the stories directory."""
+        try:
+            entries = os.scandir(self.settings.stories_dir)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".json") and entry.is_file():
+                    yield name[:-5]
 
     def list_stories(self) -> list[str]:
         """List all saved story IDs."""
-        stories_dir = self.settings.stories_dir
-        if not stories_dir.exists():
-            return []
-        return [p.stem for p in stories_dir.glob("*.json")]
+        return list(self.iter_story_ids())
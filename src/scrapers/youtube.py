@@ -3,8 +3,10 @@ YouTube video downloader using yt-dlp.
 Fetches Creative Commons Minecraft gameplay videos.
 """
 
-import json
+import os
 import random
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -13,6 +15,7 @@ from loguru import logger
 
 from config.settings import get_settings
 from src.models import VideoMetadata
+from src.utils.paths import load_json, save_json
 
 
 # Default search queries for finding gameplay videos
@@ -24,30 +27,110 @@ DEFAULT_SEARCHES = [
     "minecraft hypixel bedwars gameplay",
 ]
 
+# Fold index.log back into index.json once it has this many entries
+INDEX_LOG_COMPACT_AT = 256
+
 
 class YouTubeDownloader:
     """Download Creative Commons gameplay videos from YouTube."""
 
     def __init__(self):
         self.settings = get_settings()
-        self._downloaded_ids: set[str] = set()
-        self._load_downloaded()
+        self._downloaded_ids: set[str] | None = None
+        self._ydl_search: yt_dlp.YoutubeDL | None = None
+        self._ydl_download: yt_dlp.YoutubeDL | None = None
+
+    @property
+    def downloaded_ids(self) -> set[str]:
+        """Lazy-load the IDs of already downloaded videos."""
+        if self._downloaded_ids is None:
+            self._load_downloaded()
+        return self._downloaded_ids
+
+    @property
+    def ydl_search(self) -> yt_dlp.YoutubeDL:
+        """Lazy-initialize the flat-extraction YoutubeDL used for searches."""
+        if self._ydl_search is None:
+            self._ydl_search = yt_dlp.YoutubeDL({
+                "quiet": True,
+                "no_warnings": True,
+                "extract_flat": True,
+            })
+        return self._ydl_search
+
+    @property
+    def ydl_download(self) -> yt_dlp.YoutubeDL:
+        """
+        Lazy-initialize the YoutubeDL used for downloads.
+
+        Kept for the downloader's lifetime so extractors and the connection
+        pool are set up once. Uses aria2c for segmented multi-connection
+        downloads when it is installed.
+        """
+        if self._ydl_download is None:
+            ydl_opts = {
+                "format": "bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/best[height<=1080][ext=mp4]/best",
+                "outtmpl": str(self.settings.videos_dir / "%(id)s.%(ext)s"),
+                "quiet": False,
+                "no_warnings": False,
+                "merge_output_format": "mp4",
+            }
+            if shutil.which("aria2c"):
+                ydl_opts["external_downloader"] = {"default": "aria2c"}
+                ydl_opts["external_downloader_args"] = {
+                    "aria2c": ["-x16", "-s16", "-k1M", "--file-allocation=none"],
+                }
+            self._ydl_download = yt_dlp.YoutubeDL(ydl_opts)
+        return self._ydl_download
+
+    def close(self) -> None:
+        """Close the cached YoutubeDL instances."""
+        for ydl in (self._ydl_search, self._ydl_download):
+            if ydl is not None:
+                ydl.close()
+        self._ydl_search = None
+        self._ydl_download = None
 
     def _load_downloaded(self) -> None:
-        """Load list of already downloaded video IDs."""
+        """
+        Load the set of already downloaded video IDs.
+
+        The set is index.json plus the IDs appended to index.log since the
+        last compaction. Once the log grows past INDEX_LOG_COMPACT_AT lines
+        it is folded back into index.json.
+        """
         index_path = self.settings.videos_dir / "index.json"
+        log_path = self.settings.videos_dir / "index.log"
+        self._downloaded_ids = set()
         if index_path.exists():
-            with open(index_path, "r") as f:
-                data = json.load(f)
-                self._downloaded_ids = set(data.get("downloaded_ids", []))
+            data = load_json(index_path)
+            self._downloaded_ids = set(data.get("downloaded_ids", []))
+
+        try:
+            logged = log_path.read_bytes().decode().split()
+        except FileNotFoundError:
+            logged = []
+        self._downloaded_ids.update(logged)
+
+        if len(logged) >= INDEX_LOG_COMPACT_AT:
+            self._save_downloaded()
+            log_path.unlink(missing_ok=True)
+
         logger.debug(f"Loaded {len(self._downloaded_ids)} downloaded video IDs")
 
     def _save_downloaded(self) -> None:
-        """Save list of downloaded video IDs."""
+        """Rewrite index.json with the full set of downloaded video IDs."""
         index_path = self.settings.videos_dir / "index.json"
-        self.settings.videos_dir.mkdir(parents=True, exist_ok=True)
-        with open(index_path, "w") as f:
-            json.dump({"downloaded_ids": list(self._downloaded_ids)}, f)
+        save_json(index_path, {"downloaded_ids": list(self.downloaded_ids)})
+
+    def _record_downloaded(self, video_id: str) -> None:
+        """Mark a video as downloaded by appending its ID to index.log."""
+        if video_id in self.downloaded_ids:
+            return
+        self.downloaded_ids.add(video_id)
+        log_path = self.settings.videos_dir / "index.log"
+        with open(log_path, "ab") as f:
+            f.write(f"{video_id}\n".encode())
 
     def search_videos(
         self,
@@ -73,23 +156,18 @@ class YouTubeDownloader:
 
         logger.info(f"Searching YouTube: {query}")
 
-        ydl_opts = {
-            "quiet": True,
-            "no_warnings": True,
-            "extract_flat": True,
-            "default_search": "ytsearch" + str(max_results * 2),
-        }
-
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            result = ydl.extract_info(query, download=False)
+        result = self.ydl_search.extract_info(
+            f"ytsearch{max_results * 2}:{query}", download=False
+        )
 
+        downloaded_ids = self.downloaded_ids
         videos = []
         if result and "entries" in result:
             for entry in result["entries"]:
                 if not entry:
                     continue
                 # Skip already downloaded
-                if entry.get("id") in self._downloaded_ids:
+                if entry.get("id") in downloaded_ids:
                     continue
                 # Filter by duration if available
                 duration = entry.get("duration", 0) or 0
@@ -123,55 +201,44 @@ class YouTubeDownloader:
         if not url.startswith("http"):
             url = f"https://www.youtube.com/watch?v={url}"
 
-        ydl_opts = {
-            "format": "bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/best[height<=1080][ext=mp4]/best",
-            "outtmpl": str(self.settings.videos_dir / "%(id)s.%(ext)s"),
-            "quiet": False,
-            "no_warnings": False,
-            "merge_output_format": "mp4",
-        }
-
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                logger.info(f"Downloading: {url}")
-                info = ydl.extract_info(url, download=True)
-
-                if not info:
-                    logger.error("Failed to extract video info")
-                    return None
-
-                video_id = info.get("id", "unknown")
-                ext = info.get("ext", "mp4")
-                local_path = self.settings.videos_dir / f"{video_id}.{ext}"
-
-                # Get video dimensions
-                width = info.get("width", 1920)
-                height = info.get("height", 1080)
-
-                metadata = VideoMetadata(
-                    id=video_id,
-                    title=info.get("title", "Unknown"),
-                    source_url=info.get("webpage_url", url),
-                    local_path=local_path,
-                    duration_seconds=info.get("duration", 0),
-                    width=width,
-                    height=height,
-                    license=info.get("license", "unknown"),
-                    channel=info.get("channel", info.get("uploader", "")),
-                    downloaded_at=datetime.now(),
-                )
-
-                # Save metadata
-                meta_path = self.settings.videos_dir / f"{video_id}.json"
-                with open(meta_path, "w") as f:
-                    json.dump(metadata.model_dump(), f, indent=2, default=str)
-
-                # Track as downloaded
-                self._downloaded_ids.add(video_id)
-                self._save_downloaded()
-
-                logger.info(f"Downloaded: {metadata.title} ({metadata.duration_seconds}s)")
-                return metadata
+            logger.info(f"Downloading: {url}")
+            info = self.ydl_download.extract_info(url, download=True)
+
+            if not info:
+                logger.error("Failed to extract video info")
+                return None
+
+            video_id = info.get("id", "unknown")
+            ext = info.get("ext", "mp4")
+            local_path = self.settings.videos_dir / f"{video_id}.{ext}"
+
+            # Get video dimensions
+            width = info.get("width", 1920)
+            height = info.get("height", 1080)
+
+            metadata = VideoMetadata(
+                id=video_id,
+                title=info.get("title", "Unknown"),
+                source_url=info.get("webpage_url", url),
+                local_path=local_path,
+                duration_seconds=info.get("duration", 0),
+                width=width,
+                height=height,
+                license=info.get("license", "unknown"),
+                channel=info.get("channel", info.get("uploader", "")),
+                downloaded_at=datetime.now(),
+            )
+
+            # Save metadata
+            meta_path = self.settings.videos_dir / f"{video_id}.json"
+            save_json(meta_path, metadata.model_dump(mode="json"))
+
+            # Track as downloaded
+            self._record_downloaded(video_id)
+
+            logger.info(f"Downloaded: {metadata.title} ({metadata.duration_seconds}s)")
+            return metadata
 
         except Exception as e:
             logger.error(f"Failed to download {url}: {e}")
@@ -215,9 +282,7 @@ class YouTubeDownloader:
         meta_path = video_path.with_suffix(".json")
 
         if meta_path.exists():
-            with open(meta_path, "r") as f:
-                data = json.load(f)
-            return VideoMetadata(**data)
+            return VideoMetadata.model_validate_json(meta_path.read_bytes())
 
         # Create basic metadata if JSON doesn't exist
         return VideoMetadata(
@@ -232,11 +297,22 @@ class YouTubeDownloader:
 
     def list_videos(self) -> list[VideoMetadata]:
         """List all downloaded videos."""
-        videos = []
-        for meta_path in self.settings.videos_dir.glob("*.json"):
-            if meta_path.name == "index.json":
-                continue
-            with open(meta_path, "r") as f:
-                data = json.load(f)
-            videos.append(VideoMetadata(**data))
-        return videos
+        try:
+            entries = os.scandir(self.settings.videos_dir)
+        except FileNotFoundError:
+            return []
+        with entries:
+            meta_paths = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".json") and entry.name != "index.json"
+            ]
+        if not meta_paths:
+            return []
+
+        def load(meta_path: str) -> VideoMetadata:
+            return VideoMetadata.model_validate_json(Path(meta_path).read_bytes())
+
+        # Each load is an independent small file read
+        with ThreadPoolExecutor(max_workers=min(8, len(meta_paths))) as pool:
+            return list(pool.map(load, meta_paths))
@@ -11,6 +11,7 @@ from .paths import (
     load_json,
     save_json,
 )
+from .media import probe_duration
 from .retry import retry
 
 __all__ = [
@@ -22,4 +23,5 @@ __all__ = [
     "get_output_path",
     "save_json",
     "load_json",
+    "probe_duration",
 ]
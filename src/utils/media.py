@@ -0,0 +1,184 @@
+"""
+Media file utilities backed by the ffmpeg command-line tools.
+"""
+
+import re
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+
+_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+_SIZE_RE = re.compile(r"Video:.*?\b(\d{2,5})x(\d{2,5})\b")
+_FORMAT_RE = re.compile(r"Video: (\w+).*?, (\w+)[(,].*?([\d.]+) fps")
+_TIME_RE = re.compile(r"time=(\d+):(\d+):(\d+(?:\.\d+)?)")
+
+
+def _ffmpeg_header(path: Path) -> str:
+    """The stream summary that `ffmpeg -i` prints for a file."""
+    # ffmpeg exits non-zero without an output file; the header is on stderr
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-i", str(path)],
+        capture_output=True,
+        text=True,
+    )
+    return result.stderr
+
+
+def _header_duration(header: str, path: Path) -> float:
+    """
+    Parse the duration out of an `ffmpeg -i` header.
+
+    Streams without a container duration print "Duration: N/A". Those
+    are stream-copied to the null muxer instead, which reads packets
+    without decoding them, and the last timestamp reached is used.
+    """
+    match = _DURATION_RE.search(header)
+    if not match:
+        result = subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-nostdin",
+                "-i", str(path),
+                "-c", "copy", "-f", "null", "-",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        times = _TIME_RE.findall(result.stderr)
+        if not times:
+            raise ValueError(f"Could not read duration of {path}")
+        hours, minutes, seconds = times[-1]
+    else:
+        hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def _first_duration(values: list[str]) -> float | None:
+    """The first of `values` that is a number; ffprobe reports "N/A" when unknown."""
+    for value in values:
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
+
+
+def probe_duration(path: Path) -> float:
+    """
+    Read a media file's duration in seconds from its container header.
+
+    Uses ffprobe, falling back to the header that `ffmpeg -i` prints when
+    ffprobe isn't installed (e.g. with imageio-ffmpeg's bundled binary).
+    When the container has no duration, the streams' durations are used.
+    Nothing is decoded either way.
+    """
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-show_entries", "stream=duration:format=duration",
+                "-of", "csv=p=0",
+                str(path),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # Streams are listed before the format; prefer the container's
+        duration = _first_duration(result.stdout.split()[::-1])
+        if duration is not None:
+            return duration
+    except FileNotFoundError:
+        pass
+
+    return _header_duration(_ffmpeg_header(path), path)
+
+
+@lru_cache(maxsize=256)
+def _probe_video(path: str, mtime_ns: int, size: int) -> tuple[int, int, float]:
+    """Probe (width, height, duration); mtime and size only key the cache."""
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-select_streams", "v:0",
+                "-show_entries", "stream=width,height,duration:format=duration",
+                "-of", "default=noprint_wrappers=1",
+                path,
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        pairs = [line.split("=", 1) for line in result.stdout.split()]
+        fields = dict(pairs)
+        # The format's duration comes last; the stream's covers "N/A"
+        duration = _first_duration([v for k, v in reversed(pairs) if k == "duration"])
+        if duration is None:
+            duration = _header_duration(_ffmpeg_header(Path(path)), Path(path))
+        return int(fields["width"]), int(fields["height"]), duration
+    except FileNotFoundError:
+        pass
+
+    header = _ffmpeg_header(Path(path))
+    match = _SIZE_RE.search(header)
+    if not match:
+        raise ValueError(f"Could not read video size of {path}")
+    return int(match.group(1)), int(match.group(2)), _header_duration(header, Path(path))
+
+
+def probe_video(path: Path) -> tuple[int, int, float]:
+    """
+    Read a video's (width, height, duration) from its headers in one probe.
+
+    Same ffprobe / `ffmpeg -i` fallback as probe_duration. Results are
+    cached per file version (path, mtime and size), so asking about the
+    same file again doesn't start another process.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    return _probe_video(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _probe_video_format(path: str, mtime_ns: int, size: int) -> tuple[str, str, float]:
+    """Probe (codec, pix_fmt, fps); mtime and size only key the cache."""
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-select_streams", "v:0",
+                "-show_entries", "stream=codec_name,pix_fmt,avg_frame_rate",
+                "-of", "default=noprint_wrappers=1",
+                path,
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        fields = dict(line.split("=", 1) for line in result.stdout.split())
+        num, _, den = fields["avg_frame_rate"].partition("/")
+        fps = float(num) / float(den) if float(den or 0) else 0.0
+        return fields["codec_name"], fields["pix_fmt"], fps
+    except FileNotFoundError:
+        pass
+
+    match = _FORMAT_RE.search(_ffmpeg_header(Path(path)))
+    if not match:
+        raise ValueError(f"Could not read video format of {path}")
+    return match.group(1), match.group(2), float(match.group(3))
+
+
+def probe_video_format(path: Path) -> tuple[str, str, float]:
+    """
+    Read a video's (codec, pixel format, frame rate) from its first video
+    stream's header, cached per file version like probe_video.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    return _probe_video_format(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def probe_video_size(path: Path) -> tuple[int, int]:
+    """Read a video's (width, height) from its first video stream's header."""
+    width, height, _ = probe_video(path)
+    return width, height
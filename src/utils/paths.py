@@ -2,13 +2,31 @@
 Path utilities for Project Sloppenhimer.
 """
 
-import json
+import os
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from config.settings import get_settings
 
 
+# Directories already created by this process
+_ensured_dirs: set[Path] = set()
+
+
+def ensure_dir(path: Path) -> Path:
+    """
+    Create a directory (and parents) once per process.
+
+    Later calls for the same path skip the mkdir syscalls entirely.
+    """
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+    return path
+
+
 def ensure_dirs() -> None:
     """Create all required data directories."""
     settings = get_settings()
@@ -48,13 +66,18 @@ def get_output_path(story_id: str) -> Path:
 
 
 def save_json(path: Path, data: Any) -> None:
-    """Save data as JSON file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
+    """
+    Save data as JSON file.
+
+    Writes to a temporary sibling first and swaps it in with os.replace,
+    so readers never see a half-written file.
+    """
+    ensure_dir(path.parent)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+    os.replace(tmp_path, path)
 
 
 def load_json(path: Path) -> Any:
     """Load data from JSON file."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(Path(path).read_bytes())
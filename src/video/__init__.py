@@ -2,9 +2,17 @@
 Video processing modules.
 """
 
-from .assembler import Pipeline, VideoAssembler
-from .captions import KaraokeCaptions, create_srt_captions
-from .editor import VideoEditor
+import importlib
+
+# Exports are imported on first access, so loading one submodule (e.g.
+# captions in a worker process) doesn't drag in MoviePy and the rest
+_EXPORTS = {
+    "VideoEditor": ".editor",
+    "KaraokeCaptions": ".captions",
+    "create_srt_captions": ".captions",
+    "VideoAssembler": ".assembler",
+    "Pipeline": ".assembler",
+}
 
 __all__ = [
     "VideoEditor",
@@ -13,3 +21,11 @@ __all__ = [
     "VideoAssembler",
     "Pipeline",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve exports lazily from their submodules."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
@@ -3,17 +3,61 @@ Final video assembler.
 Combines gameplay video, TTS audio, and captions into final output.
 """
 
+import asyncio
+import hashlib
+import math
+import os
+import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+import numpy as np
 from loguru import logger
-from moviepy import VideoFileClip, AudioFileClip, CompositeVideoClip, TextClip
+from moviepy import VideoFileClip, AudioFileClip, CompositeVideoClip
+from PIL import Image
 
 from config.settings import get_settings
 from src.models import ProcessedStory, Transcript, StoryStatus, VideoMetadata
+from src.utils.media import probe_duration
 from src.video.editor import VideoEditor
-from src.video.captions import KaraokeCaptions
+from src.video.captions import create_ass_captions, render_caption_text
+from src.video.encoding import get_video_encoder
+from src.video.overlay import OverlayTrack, StaticOverlayClip
+
+
+def _filter_value(path: Path) -> str:
+    """Quote a path for use as an ffmpeg filter option value."""
+    value = Path(path).resolve().as_posix()
+    value = value.replace("'", "'\\''").replace(":", "\\:")
+    return f"'{value}'"
+
+
+def _evict_backgrounds(cache_dir: Path, keep: int) -> None:
+    """Delete all but the `keep` most recently used prepared backgrounds."""
+    cached = sorted(
+        (p for p in cache_dir.glob("bg_*.mp4") if not p.name.endswith(".tmp.mp4")),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for path in cached[max(keep, 1):]:
+        logger.debug(f"Evicting prepared background: {path.name}")
+        path.unlink(missing_ok=True)
+
+
+def _render_overlay_png(
+    clips: list,
+    video_size: tuple[int, int],
+    output_path: Path,
+) -> Path:
+    """Flatten static overlay clips into one transparent full-frame PNG."""
+    overlay = CompositeVideoClip(clips, size=video_size)
+    rgb = overlay.get_frame(0)
+    alpha = (overlay.mask.get_frame(0) * 255).round()
+    rgba = np.dstack([rgb, alpha]).astype(np.uint8)
+    # Read once by ffmpeg and deleted, so compress as little as possible
+    Image.fromarray(rgba, "RGBA").save(output_path, compress_level=1)
+    return output_path
 
 
 class VideoAssembler:
@@ -22,7 +66,6 @@ class VideoAssembler:
     def __init__(self):
         self.settings = get_settings()
         self.editor = VideoEditor()
-        self.captions = KaraokeCaptions()
 
     def assemble(
         self,
@@ -64,77 +107,135 @@ class VideoAssembler:
 
         logger.info(f"Assembling video for story: {story.original.id}")
 
-        # Get audio duration to match video
-        with AudioFileClip(str(audio_path)) as audio:
-            target_duration = audio.duration
+        # Get audio duration to match video (header only, no decode)
+        target_duration = probe_duration(audio_path)
 
         logger.info(f"Target duration: {target_duration:.1f}s, Title duration: {title_duration:.1f}s")
 
         # Prepare background video (trim/loop, scale to vertical)
+        prepared_bg_path = self._prepare_background(background_path, target_duration)
         cache_dir = self.settings.cache_dir
-        cache_dir.mkdir(parents=True, exist_ok=True)
 
-        prepared_bg_path = cache_dir / f"{story.original.id}_bg.mp4"
-        self.editor.prepare_background(
-            background_path,
-            prepared_bg_path,
-            duration=target_duration,
-            loop=True,
+        # Burn in captions and the title card in a single ffmpeg pass
+        video_size = (self.settings.video.width, self.settings.video.height)
+        with_title = show_thumbnail and title_duration > 0
+
+        # Captions are hidden while the thumbnail is shown
+        ass_path = create_ass_captions(
+            transcript,
+            cache_dir / f"{story.original.id}.ass",
+            video_size,
+            start_after=title_duration if with_title else 0.0,
         )
 
-        # Load prepared background
-        with VideoFileClip(str(prepared_bg_path)) as video:
-            with AudioFileClip(str(audio_path)) as audio:
-                # Add audio
-                video_with_audio = video.with_audio(audio)
+        overlay_path = None
+        if with_title:
+            thumbnail_clips = self.editor.create_thumbnail_overlay(
+                title=story.original.title,
+                duration=title_duration,
+                video_size=video_size,
+                username="RedditPapi"
+            )
+            overlay_path = _render_overlay_png(
+                thumbnail_clips,
+                video_size,
+                cache_dir / f"{story.original.id}_title.png",
+            )
+
+        logger.info(f"Writing final video to {output_path}")
+        self._render_with_ffmpeg(
+            prepared_bg_path,
+            audio_path,
+            ass_path,
+            output_path,
+            overlay_path=overlay_path,
+            overlay_duration=title_duration,
+        )
+        ass_path.unlink()
+        if overlay_path is not None:
+            overlay_path.unlink()
 
-                # Generate caption clips
-                video_size = (video.w, video.h)
-                caption_clips = self.captions.generate_captions(
-                    transcript, 
-                    video_size
-                )
-                
-                # Filter out captions during title if thumbnail is shown
-                if show_thumbnail and title_duration > 0:
-                    caption_clips = [
-                        clip for clip in caption_clips 
-                        if clip.start >= title_duration
-                    ]
+        logger.info(f"Video assembled successfully: {output_path}")
+        return output_path
 
-                # Create composite list
-                composite_clips = [video_with_audio] + caption_clips
+    def _prepare_background(self, background_path: Path, duration: float) -> Path:
+        """
+        Trim/loop and scale a background, reusing a cached copy when possible.
 
-                # Add thumbnail overlay if enabled
-                if show_thumbnail and title_duration > 0:
-                    thumbnail_clips = self.editor.create_thumbnail_overlay(
-                        title=story.original.title,
-                        duration=title_duration,
-                        video_size=video_size,
-                        username="RedditPapi"
-                    )
-                    composite_clips.extend(thumbnail_clips)
+        Prepared files are keyed by source, whole-second duration, size and
+        fps, so stories of similar length share a single encode.
+        """
+        video = self.settings.video
+        cache_dir = self.settings.cache_dir
+        cache_dir.mkdir(parents=True, exist_ok=True)
 
-                # Composite everything
-                final = CompositeVideoClip(composite_clips)
+        # Round up so the cached clip always covers the audio
+        seconds = math.ceil(duration)
+        key = hashlib.blake2b(
+            f"{background_path.resolve()}:{seconds}:{video.width}x{video.height}@{video.fps}".encode(),
+            digest_size=8,
+        ).hexdigest()
+        prepared_path = cache_dir / f"bg_{key}.mp4"
+
+        if prepared_path.exists():
+            os.utime(prepared_path)  # Mark as recently used
+            logger.info(f"Reusing prepared background: {prepared_path.name}")
+            return prepared_path
+
+        # Write under a temporary name so a failed render is never reused
+        tmp_path = cache_dir / f"bg_{key}.tmp.mp4"
+        self.editor.prepare_background(
+            background_path, tmp_path, duration=seconds, loop=True, is_intermediate=True
+        )
+        os.replace(tmp_path, prepared_path)
 
-                # Write final video
-                logger.info(f"Writing final video to {output_path}")
-                final.write_videofile(
-                    str(output_path),
-                    codec=self.settings.video.codec,
-                    audio_codec=self.settings.video.audio_codec,
-                    fps=self.settings.video.fps,
-                    bitrate=self.settings.video.bitrate,
-                    logger=None,
-                )
+        _evict_backgrounds(cache_dir, video.background_cache_size)
+        return prepared_path
 
-        # Cleanup temp file
-        if prepared_bg_path.exists():
-            prepared_bg_path.unlink()
+    def _render_with_ffmpeg(
+        self,
+        background_path: Path,
+        audio_path: Path,
+        ass_path: Path,
+        output_path: Path,
+        overlay_path: Path | None = None,
+        overlay_duration: float = 0.0,
+    ) -> None:
+        """
+        Render background + audio + ASS captions (+ title overlay) with ffmpeg.
 
-        logger.info(f"Video assembled successfully: {output_path}")
-        return output_path
+        libass draws the captions and overlay composites the title card in
+        native code, so no frames are rendered in Python.
+        """
+        video = self.settings.video
+
+        cmd = ["ffmpeg", "-y", "-v", "error", "-i", str(background_path), "-i", str(audio_path)]
+
+        graph = f"[0:v]ass={_filter_value(ass_path)}"
+        font_dir = Path(self.settings.caption.font).parent
+        if font_dir.is_dir():
+            graph += f":fontsdir={_filter_value(font_dir)}"
+
+        if overlay_path is not None:
+            cmd += ["-loop", "1", "-t", f"{overlay_duration:.3f}", "-i", str(overlay_path)]
+            graph += "[cap];[cap][2:v]overlay=0:0:eof_action=pass"
+        graph += "[v]"
+
+        cmd += [
+            "-filter_complex", graph,
+            "-map", "[v]", "-map", "1:a",
+            *get_video_encoder().ffmpeg_args(),
+            "-b:v", video.bitrate,
+            "-pix_fmt", "yuv420p",
+            "-r", str(video.fps),
+            "-c:a", video.audio_codec,
+            "-shortest",
+            str(output_path),
+        ]
+
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg render failed: {result.stderr.strip()}")
 
     def quick_assemble(
         self,
@@ -165,25 +266,18 @@ class VideoAssembler:
 
         logger.info(f"Quick assembling video for story: {story.original.id}")
 
-        with AudioFileClip(str(audio_path)) as audio:
-            target_duration = audio.duration
+        target_duration = probe_duration(audio_path)
 
         # Prepare background
-        cache_dir = self.settings.cache_dir
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
-        prepared_bg_path = cache_dir / f"{story.original.id}_bg.mp4"
-        self.editor.prepare_background(
-            background_path,
-            prepared_bg_path,
-            duration=target_duration,
-            loop=True,
-        )
+        prepared_bg_path = self._prepare_background(background_path, target_duration)
 
         # Create simple centered captions (segment-based, not word-by-word)
         with VideoFileClip(str(prepared_bg_path)) as video:
             with AudioFileClip(str(audio_path)) as audio:
-                video_with_audio = video.with_audio(audio)
+                # Cached backgrounds are rounded up to whole seconds
+                video_with_audio = video.subclipped(
+                    0, min(target_duration, video.duration)
+                ).with_audio(audio)
                 video_size = (video.w, video.h)
 
                 # Create segment-based captions
@@ -195,17 +289,8 @@ class VideoAssembler:
                     if show_thumbnail and segment.start_time < title_duration:
                         continue
                         
-                    text = segment.text
-                    clip = TextClip(
-                        text=text,
-                        font_size=self.settings.caption.font_size,
-                        color=self.settings.caption.color,
-                        font=self.settings.caption.font,
-                        stroke_color=self.settings.caption.stroke_color,
-                        stroke_width=self.settings.caption.stroke_width,
-                        method="caption",
-                        size=(video_size[0] - 80, None),
-                        text_align="center",
+                    clip = StaticOverlayClip(
+                        render_caption_text(segment.text, video_size[0] - 80)
                     )
                     clip = (
                         clip
@@ -215,8 +300,8 @@ class VideoAssembler:
                     )
                     caption_clips.append(clip)
 
-                # Create composite list
-                composite_clips = [video_with_audio] + caption_clips
+                # Captions and thumbnail share one overlay layer
+                overlay_clips = list(caption_clips)
 
                 # Add thumbnail overlay
                 if show_thumbnail and title_duration > 0:
@@ -226,23 +311,23 @@ class VideoAssembler:
                         video_size=video_size,
                         username="RedditPapi"
                     )
-                    composite_clips.extend(thumbnail_clips)
+                    overlay_clips.extend(thumbnail_clips)
 
-                final = CompositeVideoClip(composite_clips)
+                # use_bgclip drops the background's audio, so reattach it
+                track = OverlayTrack(overlay_clips, video_size, video_with_audio.duration)
+                final = CompositeVideoClip(
+                    [video_with_audio, track], use_bgclip=True
+                ).with_audio(video_with_audio.audio)
 
                 final.write_videofile(
                     str(output_path),
-                    codec=self.settings.video.codec,
                     audio_codec=self.settings.video.audio_codec,
                     fps=self.settings.video.fps,
                     bitrate=self.settings.video.bitrate,
                     logger=None,
+                    **get_video_encoder().write_kwargs(),
                 )
 
-        # Cleanup
-        if prepared_bg_path.exists():
-            prepared_bg_path.unlink()
-
         logger.info(f"Video assembled: {output_path}")
         return output_path
 
@@ -288,6 +373,93 @@ class Pipeline:
             self._youtube = YouTubeDownloader()
         return self._youtube
 
+    def _simplify_step(self, job: dict) -> dict | None:
+        """Load the story and simplify it with the LLM."""
+        from src.scrapers import RedditScraper
+
+        story_id = job["story_id"]
+        story = RedditScraper().load_story(story_id)
+        if not story:
+            logger.error(f"Story not found: {story_id}")
+            return None
+
+        logger.info(f"Step 1/5: Simplifying story {story_id} with LLM")
+        job["story"] = story
+        job["processed"] = self.llm.simplify_story(story)
+        return job
+
+    def _tts_step(self, job: dict) -> dict:
+        """Generate narration audio (title + body when showing the thumbnail)."""
+        story_id = job["story_id"]
+        logger.info(f"Step 2/5: Generating TTS audio for {story_id}")
+        audio_path = self.settings.audio_dir / f"{story_id}.mp3"
+        body = job["processed"].simplified_text
+
+        if job["show_thumbnail"]:
+            # Generate combined audio with title first
+            audio_path, title_duration = self.tts.generate_title_and_body_audio(
+                title=job["story"].title,
+                body=body,
+                output_path=audio_path,
+                pause_duration=1.0  # 1 second pause between title and body
+            )
+        else:
+            # Just body audio
+            self.tts.generate_audio(body, audio_path)
+            title_duration = 0.0
+
+        job["audio_path"] = audio_path
+        job["title_duration"] = title_duration
+        return job
+
+    def _transcribe_step(self, job: dict) -> dict:
+        """Transcribe the narration for word timings."""
+        logger.info(f"Step 3/5: Transcribing audio for {job['story_id']}")
+        job["transcript"], _ = self.transcriber.transcribe_and_save(job["audio_path"])
+        return job
+
+    def _assemble_step(self, job: dict) -> dict | None:
+        """Pick a background video and render the final output."""
+        logger.info(f"Step 4/5: Selecting background video for {job['story_id']}")
+        background = self.youtube.get_random_video()
+        if not background:
+            logger.warning("No background videos available, downloading one...")
+            videos = self.youtube.download_random(count=1)
+            if not videos:
+                logger.error("Failed to get background video")
+                return None
+            background = videos[0]
+
+        logger.info(f"Step 5/5: Assembling final video for {job['story_id']}")
+        assemble = (
+            self.assembler.quick_assemble if job["quick_mode"] else self.assembler.assemble
+        )
+        processed = job["processed"]
+        output = assemble(
+            processed,
+            background,
+            job["audio_path"],
+            job["transcript"],
+            title_duration=job["title_duration"],
+            show_thumbnail=job["show_thumbnail"],
+        )
+
+        # Update story status
+        processed.status = StoryStatus.ASSEMBLED
+        processed.output_video_path = output
+
+        job["output"] = output
+        return job
+
+    def _stages(self) -> list[tuple[Callable[[dict], dict | None], int]]:
+        """Pipeline stages in order, with how many stories each may run at once."""
+        return [
+            (self._simplify_step, max(1, self.settings.ollama.parallel)),
+            (self._tts_step, 1),
+            (self._transcribe_step, 1),  # Whisper holds the GPU
+            (self._assemble_step, 1),  # ffmpeg already uses every core
+        ]
+
     def process_story(
         self,
         story_id: str,
@@ -305,82 +477,99 @@ class Pipeline:
         Returns:
             Path to output video or None if failed
         """
-        from src.scrapers import RedditScraper
-
         logger.info(f"Starting pipeline for story: {story_id}")
 
-        # Load story
-        scraper = RedditScraper()
-        story = scraper.load_story(story_id)
-        if not story:
-            logger.error(f"Story not found: {story_id}")
-            return None
+        job = {
+            "story_id": story_id,
+            "quick_mode": quick_mode,
+            "show_thumbnail": show_thumbnail,
+        }
 
         try:
-            # 1. Simplify with LLM
-            logger.info("Step 1/5: Simplifying story with LLM")
-            processed = self.llm.simplify_story(story)
-
-            # 2. Generate TTS audio (title + body)
-            logger.info("Step 2/5: Generating TTS audio with title")
-            audio_path = self.settings.audio_dir / f"{story_id}.mp3"
-            
-            if show_thumbnail:
-                # Generate combined audio with title first
-                audio_path, title_duration = self.tts.generate_title_and_body_audio(
-                    title=story.title,
-                    body=processed.simplified_text,
-                    output_path=audio_path,
-                    pause_duration=1.0  # 1 second pause between title and body
-                )
-            else:
-                # Just body audio
-                self.tts.generate_audio(processed.simplified_text, audio_path)
-                title_duration = 0.0
-
-            # 3. Transcribe for word timing
-            logger.info("Step 3/5: Transcribing audio for timestamps")
-            transcript, _ = self.transcriber.transcribe_and_save(audio_path)
-
-            # 4. Get background video
-            logger.info("Step 4/5: Selecting background video")
-            background = self.youtube.get_random_video()
-            if not background:
-                logger.warning("No background videos available, downloading one...")
-                videos = self.youtube.download_random(count=1)
-                if not videos:
-                    logger.error("Failed to get background video")
+            for step, _ in self._stages():
+                job = step(job)
+                if job is None:
                     return None
-                background = videos[0]
-
-            # 5. Assemble final video
-            logger.info("Step 5/5: Assembling final video with thumbnail")
-            if quick_mode:
-                output = self.assembler.quick_assemble(
-                    processed, 
-                    background, 
-                    audio_path, 
-                    transcript,
-                    title_duration=title_duration,
-                    show_thumbnail=show_thumbnail
-                )
-            else:
-                output = self.assembler.assemble(
-                    processed, 
-                    background, 
-                    audio_path, 
-                    transcript,
-                    title_duration=title_duration,
-                    show_thumbnail=show_thumbnail
-                )
+        except Exception as e:
+            logger.error(f"Pipeline failed for {story_id}: {e}")
+            return None
 
-            # Update story status
-            processed.status = StoryStatus.ASSEMBLED
-            processed.output_video_path = output
+        logger.info(f"Pipeline complete! Output: {job['output']}")
+        return job["output"]
 
-            logger.info(f"Pipeline complete! Output: {output}")
-            return output
+    def process_many(
+        self,
+        story_ids: list[str],
+        quick_mode: bool = False,
+        show_thumbnail: bool = True,
+    ) -> dict[str, Optional[Path]]:
+        """
+        Process several stories with the pipeline stages overlapped.
 
-        except Exception as e:
-            logger.error(f"Pipeline failed for {story_id}: {e}")
-            return None
\ No newline at end of file
+        While one story is being rendered, the next is transcribed and the
+        one after that narrated, so a batch takes roughly as long as its
+        slowest stage rather than the sum of all of them.
+
+        Args:
+            story_ids: IDs of the stories to process
+            quick_mode: Use faster rendering without word-by-word captions
+            show_thumbnail: Show title thumbnail at beginning
+
+        Returns:
+            Mapping of story ID to output video path (None if it failed)
+        """
+        return asyncio.run(
+            self._process_many_async(story_ids, quick_mode, show_thumbnail)
+        )
+
+    async def _process_many_async(
+        self,
+        story_ids: list[str],
+        quick_mode: bool,
+        show_thumbnail: bool,
+    ) -> dict[str, Optional[Path]]:
+        """Run each stage as a pool of workers connected by bounded queues."""
+        results: dict[str, Optional[Path]] = dict.fromkeys(story_ids)
+        stages = self._stages()
+        # Small queues keep at most a couple of finished stories waiting per stage
+        queues = [asyncio.Queue(maxsize=2) for _ in stages]
+
+        async def run_stage(index: int) -> None:
+            step, workers = stages[index]
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(stages) else None
+
+            async def work() -> None:
+                # None is the shutdown sentinel
+                while (job := await inbox.get()) is not None:
+                    story_id = job["story_id"]
+                    try:
+                        job = await asyncio.to_thread(step, job)
+                    except Exception as e:
+                        logger.error(f"Pipeline failed for {story_id}: {e}")
+                        continue
+                    if job is None:
+                        continue
+                    if outbox is not None:
+                        await outbox.put(job)
+                    else:
+                        results[story_id] = job["output"]
+                        logger.info(f"Pipeline complete! Output: {job['output']}")
+
+            await asyncio.gather(*(work() for _ in range(workers)))
+            if outbox is not None:
+                for _ in range(stages[index + 1][1]):
+                    await outbox.put(None)
+
+        async def feed() -> None:
+            for story_id in story_ids:
+                await queues[0].put({
+                    "story_id": story_id,
+                    "quick_mode": quick_mode,
+                    "show_thumbnail": show_thumbnail,
+                })
+            for _ in range(stages[0][1]):
+                await queues[0].put(None)
+
+        await asyncio.gather(feed(), *(run_stage(i) for i in range(len(stages))))
+        return results
@@ -3,17 +3,35 @@ Karaoke-style caption generator.
 Creates word-by-word highlighted captions for video.
 """
 
+import hashlib
+import math
+import os
+import re
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Callable
 import textwrap
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
 from loguru import logger
-from moviepy import TextClip, CompositeVideoClip, VideoFileClip, ImageClip
 
 from config.settings import get_settings
 from src.models import Transcript, WordTiming, CaptionSegment
+from src.utils.media import probe_video
+from src.video.encoding import get_video_encoder
+
+# Each worker process needs at least this many segments to pay for itself
+PARALLEL_MIN_SEGMENTS = 32
+
+# Rendered transcripts kept in the caption cache
+CAPTION_CACHE_SIZE = 32
+
+# Words within a rendered line, located to draw each one separately
+_WORD_RE = re.compile(r"\S+")
 
 
 class KaraokeCaptions:
@@ -22,100 +40,148 @@ class KaraokeCaptions:
     def __init__(self):
         self.settings = get_settings()
 
+        # Snapshot caption style; settings attribute access isn't free and
+        # the style is read for every segment
+        caption = self.settings.caption
+        self.font = caption.font
+        self.font_size = caption.font_size
+        self.default_color, self.highlight_color = self._parse_colors(caption)
+
+    def _parse_colors(self, caption) -> tuple[tuple, tuple]:
+        """Resolve the (default, highlight) caption colors once."""
+        if caption.color.startswith('#'):
+            default_color = self._hex_to_rgb(caption.color)
+        else:
+            default_color = (255, 255, 255)  # white
+
+        if caption.highlight_color.startswith('#'):
+            highlight_color = self._hex_to_rgb(caption.highlight_color)
+        else:
+            highlight_color = (255, 255, 0)  # yellow
+
+        return default_color, highlight_color
+
     def _hex_to_rgb(self, hex_color: str) -> tuple:
         """Convert hex color to RGB tuple."""
         hex_color = hex_color.lstrip('#')
         return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
-    def _create_text_image_with_highlight(
-        self,
+    @staticmethod
+    def _layout_words(
         words: list[WordTiming],
-        highlight_index: int,
         width: int,
+        font: ImageFont.FreeTypeFont,
         font_size: int,
-        max_chars: int
-    ) -> np.ndarray:
+        max_chars: int,
+    ) -> tuple[tuple[tuple[int, int, str], ...], list[tuple[int, int, int, int]], int]:
         """
-        Create a PIL image with text where one word is highlighted.
-        
+        Wrap a segment and center each line, recording every word's box.
+
         Args:
             words: List of word timings
-            highlight_index: Index of word to highlight
             width: Image width
+            font: Font to measure with
             font_size: Font size
             max_chars: Max characters per line for wrapping
-            
+
         Returns:
-            numpy array of RGBA image
+            ((x, y, line) for each line, (x0, y0, x1, y1) ink box for each
+            word in order, image height)
         """
-        # Build and wrap text
         full_text = " ".join(w.word for w in words)
-        wrapped_text = self._wrap_text_properly(full_text, max_chars)
-        lines = wrapped_text.split('\n')
-        
-        # Load font
-        try:
-            font = ImageFont.truetype(self.settings.caption.font, font_size)
-        except:
-            font = ImageFont.load_default()
-        
-        # Calculate image height
+        lines = KaraokeCaptions._wrap_text_properly(full_text, max_chars).split('\n')
+
         line_height = font_size + 10
         height = len(lines) * line_height + 40
-        
-        # Create transparent image
-        img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        # Parse colors
-        if self.settings.caption.color.startswith('#'):
-            default_color = self._hex_to_rgb(self.settings.caption.color)
-        else:
-            default_color = (255, 255, 255)  # white
-            
-        if self.settings.caption.highlight_color.startswith('#'):
-            highlight_color = self._hex_to_rgb(self.settings.caption.highlight_color)
-        else:
-            highlight_color = (255, 255, 0)  # yellow
-        
-        # Track word index as we render
-        word_index = 0
+
+        line_layout = []
+        boxes = []
         y_offset = 20
-        
         for line in lines:
-            line_words = line.split()
-            
-            # Calculate starting x for centered text
-            try:
-                bbox = draw.textbbox((0, 0), line, font=font)
-                line_width = bbox[2] - bbox[0]
-            except:
-                line_width = len(line) * (font_size // 2)
-            
-            x_offset = (width - line_width) // 2
-            
-            # Draw each word
-            for word_text in line_words:
-                # Determine color
-                color = highlight_color if word_index == highlight_index else default_color
-                
-                # Draw word
-                draw.text((x_offset, y_offset), word_text, font=font, fill=color)
-                
-                # Move x position
-                try:
-                    bbox = draw.textbbox((0, 0), word_text + ' ', font=font)
-                    word_width = bbox[2] - bbox[0]
-                except:
-                    word_width = len(word_text + ' ') * (font_size // 2)
-                
-                x_offset += word_width
-                word_index += 1
-            
+            x_offset = (width - int(font.getlength(line))) // 2
+            line_layout.append((x_offset, y_offset, line))
+
+            # Word boxes follow the same advances PIL uses to draw the line,
+            # padded a pixel for antialiasing and clamped to the image
+            column = 0
+            for word_text in line.split():
+                column = line.index(word_text, column)
+                left, top, right, bottom = font.getbbox(word_text)
+                x = x_offset + font.getlength(line[:column])
+                boxes.append((
+                    max(0, math.floor(x + left) - 1),
+                    max(0, y_offset + top - 1),
+                    min(width, math.ceil(x + right) + 1),
+                    min(height, y_offset + bottom + 1),
+                ))
+                column += len(word_text)
             y_offset += line_height
-        
-        # Convert to numpy array
-        return np.array(img)
+
+        return tuple(line_layout), boxes, height
+
+    def _style(self) -> tuple[str, int, tuple, tuple]:
+        """(font path, font size, default color, highlight color) for rendering."""
+        return (self.font, self.font_size, self.default_color, self.highlight_color)
+
+    @staticmethod
+    def _render_segment(
+        segment: CaptionSegment,
+        video_size: tuple[int, int],
+        style: tuple[str, int, tuple, tuple],
+    ) -> list[tuple[np.ndarray, tuple, float, float, tuple]]:
+        """
+        Rasterize one segment's base paragraph and word tiles.
+
+        Takes and returns only plain data so it can run in a worker process.
+        Caption text is a flat color, so each clip is returned as an 8-bit
+        coverage mask plus its color rather than a full RGBA image.
+
+        Args:
+            segment: Caption segment with word timings
+            video_size: (width, height) of video
+            style: From _style()
+
+        Returns:
+            (coverage array, color, start, duration, position) for each clip
+        """
+        width, height = video_size
+
+        if not segment.words:
+            return []
+
+        font_path, font_size, default_color, highlight_color = style
+        font = _load_font(font_path, font_size)
+        approx_chars_per_line = (width - 80) // (font_size // 2)
+
+        lines, boxes, img_height = KaraokeCaptions._layout_words(
+            segment.words, width, font, font_size, approx_chars_per_line
+        )
+
+        # Center vertically
+        y_pos = int(height * 0.5 - img_height * 0.5)
+
+        # One coverage mask serves both colors; highlights are cut out of it
+        coverage = _render_coverage(lines, (width, img_height), font_path, font_size)
+
+        start = segment.words[0].start_time
+        rendered = [(
+            coverage, default_color, start,
+            segment.words[-1].end_time - start, ("center", y_pos),
+        )]
+
+        # The base is as wide as the video, so box x is already absolute
+        for current_word, (x0, y0, x1, y1) in zip(segment.words, boxes):
+            if x1 <= x0 or y1 <= y0:
+                continue
+            rendered.append((
+                coverage[y0:y1, x0:x1],
+                highlight_color,
+                current_word.start_time,
+                current_word.end_time - current_word.start_time,
+                (x0, y_pos + y0),
+            ))
+
+        return rendered
 
     def _create_karaoke_with_highlight(
         self,
@@ -124,43 +190,54 @@ class KaraokeCaptions:
     ) -> list:
         """
         Create karaoke captions with word-by-word yellow highlighting using PIL.
+
+        The segment text is drawn once as a base clip spanning the whole
+        segment; each word then only adds a small tile of itself, sliced
+        from the same text drawn in the highlight color.
+        """
+        return self._build_clips(
+            self._render_segment(segment, video_size, self._style())
+        )
+
+    @staticmethod
+    def _build_clips(rendered: list[tuple[np.ndarray, tuple, float, float, tuple]]) -> list:
         """
+        Turn rendered (coverage, color, start, duration, position) tuples into clips.
+
+        Identical arrays share one clip, so its PIL image and mask are built
+        once. A clip that picks up exactly where an identical one at the
+        same position left off (e.g. a repeated short segment) extends it
+        instead of adding another overlay.
+        """
+        from src.video.overlay import StaticOverlayClip
+
+        shared = {}
+        latest = {}
         clips = []
-        width, height = video_size
-        
-        if not segment.words:
-            return clips
-        
-        approx_chars_per_line = (width - 80) // (self.settings.caption.font_size // 2)
-        
-        # Create image clip for each word timing
-        for i, current_word in enumerate(segment.words):
-            # Generate image with current word highlighted
-            img_array = self._create_text_image_with_highlight(
-                segment.words,
-                i,
-                width,
-                self.settings.caption.font_size,
-                approx_chars_per_line
+        for coverage, color, start, duration, position in rendered:
+            key = (
+                coverage.shape,
+                color,
+                hashlib.blake2b(coverage.tobytes(), digest_size=16).digest(),
             )
-            
-            # Create ImageClip from array
-            img_clip = ImageClip(img_array, duration=current_word.end_time - current_word.start_time)
-            
-            # Center vertically
-            y_pos = int(height * 0.5 - img_clip.h * 0.5)
-            
-            img_clip = (
-                img_clip
-                .with_position(("center", y_pos))
-                .with_start(current_word.start_time)
+            if key not in shared:
+                shared[key] = StaticOverlayClip(_colorize(coverage, color))
+
+            index = latest.get((key, position))
+            if index is not None and abs(clips[index].end - start) < 1e-3:
+                previous = clips[index]
+                clips[index] = previous.with_duration(start + duration - previous.start)
+                continue
+
+            latest[(key, position)] = len(clips)
+            clips.append(
+                shared[key].with_position(position).with_start(start).with_duration(duration)
             )
-            
-            clips.append(img_clip)
-        
+
         return clips
 
-    def _wrap_text_properly(self, text: str, max_width: int) -> str:
+    @staticmethod
+    def _wrap_text_properly(text: str, max_width: int) -> str:
         """
         Wrap text ensuring words are not split across lines.
         
@@ -198,16 +275,60 @@ class KaraokeCaptions:
         Returns:
             List of clip objects
         """
-        all_clips = []
+        return self._build_clips(self._render_transcript(transcript, video_size))
+
+    def _render_transcript(
+        self,
+        transcript: Transcript,
+        video_size: tuple[int, int],
+    ) -> list[tuple[np.ndarray, tuple, float, float, tuple]]:
+        """Rasterize every segment of a transcript (see _render_segment)."""
         segments = transcript.get_segments_v2()
+        style = self._style()
+
+        # Rendering is deterministic, so re-runs on the same transcript
+        # only need the cached masks
+        cache_path = self._cache_path(transcript, video_size, style)
+        rendered = _load_rendered(cache_path)
+        if rendered is not None:
+            logger.info(f"Reusing rendered captions: {cache_path.name}")
+            return rendered
 
         logger.info(f"Generating captions for {len(segments)} segments")
 
-        for segment in segments:
-            clips = self._create_karaoke_with_highlight(segment, video_size)
-            all_clips.extend(clips)
+        # Rasterizing is CPU-bound Python/PIL work that holds the GIL, so
+        # long transcripts are split across processes. Only the arrays come
+        # back; clips are built here.
+        workers = min(os.cpu_count() or 1, len(segments) // PARALLEL_MIN_SEGMENTS)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                rendered = list(pool.map(
+                    self._render_segment,
+                    segments,
+                    repeat(video_size),
+                    repeat(style),
+                    chunksize=max(1, len(segments) // (workers * 4)),
+                ))
+        else:
+            rendered = [self._render_segment(s, video_size, style) for s in segments]
 
-        return all_clips
+        rendered = [item for items in rendered for item in items]
+        _save_rendered(cache_path, rendered)
+        _evict_rendered(cache_path.parent, CAPTION_CACHE_SIZE)
+        return rendered
+
+    def _cache_path(
+        self,
+        transcript: Transcript,
+        video_size: tuple[int, int],
+        style: tuple[str, int, tuple, tuple],
+    ) -> Path:
+        """Caption cache file for this transcript, video size and style."""
+        key = hashlib.blake2b(
+            transcript.model_dump_json().encode() + repr((video_size, style)).encode(),
+            digest_size=8,
+        ).hexdigest()
+        return self.settings.cache_dir / "captions" / f"{key}.npz"
 
     def apply_captions(
         self,
@@ -218,6 +339,10 @@ class KaraokeCaptions:
         """
         Apply karaoke captions to video.
 
+        The captions are flattened into a single transparent image track
+        (see _write_overlay_track) that ffmpeg overlays and encodes in one
+        pass, so no video frames go through Python.
+
         Args:
             video_path: Source video path
             transcript: Transcript with word timings
@@ -231,25 +356,118 @@ class KaraokeCaptions:
 
         logger.info(f"Applying captions to {video_path}")
 
-        with VideoFileClip(str(video_path)) as video:
-            video_size = (video.w, video.h)
-            caption_clips = self.generate_captions(transcript, video_size)
+        width, height, duration = probe_video(video_path)
+        video_size = (width, height)
+        rendered = self._render_transcript(transcript, video_size)
 
-            # Composite video with captions
-            final = CompositeVideoClip([video] + caption_clips)
+        with tempfile.TemporaryDirectory(prefix="captions_") as track_dir:
+            track_path = _write_overlay_track(
+                rendered, video_size, duration, Path(track_dir)
+            )
 
             logger.info(f"Writing captioned video to {output_path}")
-            final.write_videofile(
-                str(output_path),
-                codec="libx264",
-                audio_codec="aac",
-                fps=self.settings.video.fps,
-                logger=None,
+            result = subprocess.run(
+                [
+                    "ffmpeg", "-y", "-v", "error",
+                    "-i", str(video_path),
+                    "-f", "concat", "-i", str(track_path),
+                    "-filter_complex", "[0:v][1:v]overlay=0:0:eof_action=pass[v]",
+                    "-map", "[v]", "-map", "0:a?",
+                    *get_video_encoder().ffmpeg_args(),
+                    "-pix_fmt", "yuv420p",
+                    "-r", str(self.settings.video.fps),
+                    "-c:a", "aac",
+                    str(output_path),
+                ],
+                capture_output=True,
+                text=True,
             )
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg caption render failed: {result.stderr.strip()}")
+
+        # Tiles are only reused within a transcript; don't hold on to them
+        _render_coverage.cache_clear()
 
         return output_path
 
 
+def _write_overlay_track(
+    rendered: list[tuple[np.ndarray, tuple, float, float, tuple]],
+    video_size: tuple[int, int],
+    duration: float,
+    track_dir: Path,
+) -> Path:
+    """
+    Flatten rendered caption clips into an ffconcat image sequence.
+
+    Each stretch of time in which the same clips are showing becomes one
+    full-frame transparent PNG held for that long, so the whole caption
+    track is a single ffmpeg input. Stretches showing the same clips share
+    a file.
+
+    Args:
+        rendered: (coverage, color, start, duration, position) per clip
+        video_size: (width, height) of video
+        duration: Video duration in seconds
+        track_dir: Directory for the images and the list
+
+    Returns:
+        Path to the ffconcat list
+    """
+    width = video_size[0]
+    ends = [start + length for _, _, start, length, _ in rendered]
+
+    times = {0.0, duration}
+    for (_, _, start, _, _), end in zip(rendered, ends):
+        times.update((start, end))
+    bounds = sorted(t for t in times if 0.0 <= t <= duration)
+
+    # Sweep the intervals, tracking which clips are showing
+    by_start = sorted(range(len(rendered)), key=lambda i: rendered[i][2])
+    entries: list[list] = []
+    active: list[int] = []
+    upcoming = 0
+    for t0, t1 in zip(bounds, bounds[1:]):
+        while upcoming < len(by_start) and rendered[by_start[upcoming]][2] <= t0:
+            active.append(by_start[upcoming])
+            upcoming += 1
+        active = [i for i in active if ends[i] > t0]
+
+        # Indices keep the clips' layer order
+        showing = tuple(sorted(active))
+        if entries and entries[-1][0] == showing:
+            entries[-1][1] += t1 - t0
+        else:
+            entries.append([showing, t1 - t0])
+    if not entries:
+        entries.append([(), duration])
+
+    files: dict[tuple, str] = {}
+    lines = ["ffconcat version 1.0"]
+    for showing, length in entries:
+        if showing not in files:
+            canvas = Image.new("RGBA", video_size, (0, 0, 0, 0))
+            for i in showing:
+                coverage, color, _, _, (x, y) = rendered[i]
+                if x == "center":
+                    x = (width - coverage.shape[1]) // 2
+                canvas.alpha_composite(
+                    Image.fromarray(_colorize(coverage, color), "RGBA"),
+                    dest=(max(x, 0), max(y, 0)),
+                    source=(max(-x, 0), max(-y, 0)),
+                )
+            files[showing] = f"caption_{len(files):05d}.png"
+            canvas.save(track_dir / files[showing], compress_level=1)
+        lines += [f"file {files[showing]}", f"duration {length:.6f}"]
+
+    # The concat demuxer ignores the last entry's duration; repeat it
+    lines.append(f"file {files[entries[-1][0]]}")
+
+    track_path = track_dir / "captions.ffconcat"
+    track_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return track_path
+
+
 def create_srt_captions(transcript: Transcript, output_path: Path) -> Path:
     """
     Create SRT subtitle file from transcript.
@@ -264,8 +482,398 @@ def create_srt_captions(transcript: Transcript, output_path: Path) -> Path:
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    srt_content = transcript.to_srt()
-    output_path.write_text(srt_content, encoding="utf-8")
+    transcript.write_srt(output_path)
 
     logger.info(f"Created SRT file: {output_path}")
-    return output_path
\ No newline at end of file
+    return output_path
+
+
+@lru_cache(maxsize=16)
+def _load_font(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """Load a font once per (path, size), falling back to PIL's default."""
+    try:
+        return ImageFont.truetype(font_path, font_size)
+    except OSError:
+        return ImageFont.load_default(font_size)
+
+
+@lru_cache(maxsize=512)
+def _render_coverage(
+    layout: tuple[tuple[int, int, str], ...],
+    size: tuple[int, int],
+    font_path: str,
+    font_size: int,
+) -> np.ndarray:
+    """
+    Render a laid-out segment's glyph coverage (memoized).
+
+    Drawing flat-colored text on a transparent image only varies the
+    alpha, so this mask plus a color is the whole image (see _colorize).
+
+    Args:
+        layout: (x, y, line) positions from KaraokeCaptions._layout_words
+        size: (width, height) of the image
+        font_path: Font file
+        font_size: Font size
+
+    Returns:
+        uint8 (height, width) alpha mask (read-only, it is shared between callers)
+    """
+    font = _load_font(font_path, font_size)
+
+    img = Image.new('L', size, 0)
+    draw = ImageDraw.Draw(img)
+
+    for x, y, line in layout:
+        draw.text((x, y), line, font=font, fill=255)
+
+    array = np.array(img)
+    array.flags.writeable = False
+    return array
+
+
+def _colorize(coverage: np.ndarray, color: tuple) -> np.ndarray:
+    """Expand a coverage mask into an RGBA image of flat `color`."""
+    lut = np.empty((256, 4), dtype=np.uint8)
+    lut[:, :3] = color
+    lut[:, 3] = np.arange(256)
+    return lut[coverage]
+
+
+def _save_rendered(
+    path: Path,
+    rendered: list[tuple[np.ndarray, tuple, float, float, tuple]],
+) -> None:
+    """
+    Write rendered caption clips to an .npz file.
+
+    Masks are stored flattened into one buffer alongside their shapes, so
+    the file has a handful of arrays however many clips there are.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    masks = [np.ascontiguousarray(coverage).ravel() for coverage, *_ in rendered]
+
+    # Write under a temporary name so a failed write is never reused
+    tmp_path = path.with_suffix(".tmp.npz")
+    np.savez_compressed(
+        tmp_path,
+        masks=np.concatenate(masks) if masks else np.empty(0, dtype=np.uint8),
+        shapes=np.array([item[0].shape for item in rendered], dtype=np.int64).reshape(-1, 2),
+        colors=np.array([item[1] for item in rendered], dtype=np.uint8).reshape(-1, 3),
+        times=np.array([item[2:4] for item in rendered], dtype=np.float64).reshape(-1, 2),
+        # Horizontal centering is stored as x = -1
+        positions=np.array(
+            [(-1 if x == "center" else x, y) for *_, (x, y) in rendered], dtype=np.int64
+        ).reshape(-1, 2),
+    )
+    os.replace(tmp_path, path)
+
+
+def _load_rendered(path: Path) -> list[tuple[np.ndarray, tuple, float, float, tuple]] | None:
+    """Read clips written by _save_rendered, or None if not cached."""
+    try:
+        data = np.load(path)
+    except FileNotFoundError:
+        return None
+    os.utime(path)  # Mark as recently used
+
+    with data:
+        masks = data["masks"]
+        shapes, colors = data["shapes"], data["colors"]
+        times, positions = data["times"], data["positions"]
+
+    rendered = []
+    offset = 0
+    for (h, w), color, (start, duration), (x, y) in zip(
+        shapes.tolist(), colors.tolist(), times.tolist(), positions.tolist()
+    ):
+        coverage = masks[offset:offset + h * w].reshape(h, w)
+        offset += h * w
+        rendered.append((
+            coverage, tuple(color), start, duration, ("center" if x == -1 else x, y)
+        ))
+    return rendered
+
+
+def _evict_rendered(cache_dir: Path, keep: int) -> None:
+    """Delete all but the `keep` most recently used rendered transcripts."""
+    cached = sorted(
+        (p for p in cache_dir.glob("*.npz") if not p.name.endswith(".tmp.npz")),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for path in cached[max(keep, 1):]:
+        path.unlink(missing_ok=True)
+
+
+def _rgb(color: str, default: tuple[int, int, int]) -> tuple[int, int, int]:
+    """Parse a CSS color name or hex string to RGB."""
+    try:
+        return ImageColor.getrgb(color)[:3]
+    except ValueError:
+        return default
+
+
+@lru_cache(maxsize=256)
+def render_text(
+    text: str,
+    font_path: str,
+    font_size: int,
+    color: str,
+    max_width: int | None = None,
+    align: str = "center",
+    stroke_color: str | None = None,
+    stroke_width: int = 0,
+) -> np.ndarray:
+    """
+    Render text as an RGBA array with PIL (memoized).
+
+    Stands in for MoviePy's TextClip: explicit newlines start new lines,
+    and with max_width set, lines are word-wrapped on measured pixel
+    widths the way TextClip(method="caption") wraps them.
+
+    Args:
+        text: Text to draw
+        font_path: Font file
+        font_size: Font size
+        color: Text color (CSS name or hex)
+        max_width: Wrap width in pixels, or None to size to the text
+        align: "left", "center" or "right"
+        stroke_color: Outline color (CSS name or hex)
+        stroke_width: Outline width in pixels
+
+    Returns:
+        numpy array of RGBA image (read-only, it is shared between callers)
+    """
+    font = _load_font(font_path, font_size)
+    stroke = stroke_width
+
+    lines: list[str] = []
+    for paragraph in text.split("\n"):
+        if max_width is None:
+            lines.append(paragraph)
+            continue
+        # Greedy word wrap on measured pixel widths
+        start = len(lines)
+        for word in paragraph.split():
+            if (
+                len(lines) > start
+                and font.getlength(f"{lines[-1]} {word}") + 2 * stroke <= max_width
+            ):
+                lines[-1] = f"{lines[-1]} {word}"
+            else:
+                lines.append(word)
+        if len(lines) == start:
+            lines.append("")
+
+    if max_width is None:
+        width = math.ceil(max(font.getlength(line) for line in lines)) + 2 * stroke
+    else:
+        width = max_width
+
+    ascent, descent = font.getmetrics()
+    line_height = ascent + descent + 2 * stroke
+    img = Image.new("RGBA", (max(width, 1), line_height * len(lines)), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    x, anchor = {
+        "left": (stroke, "la"),
+        "right": (width - stroke, "ra"),
+    }.get(align, (width // 2, "ma"))
+    fill = _rgb(color, (255, 255, 255))
+    stroke_fill = _rgb(stroke_color, (0, 0, 0)) if stroke_color else None
+    for i, line in enumerate(lines):
+        if stroke:
+            # Outlined text is assembled from cached per-word tiles
+            line_width = font.getlength(line)
+            origin = {
+                "left": stroke,
+                "right": width - stroke - line_width,
+            }.get(align, width // 2 - math.ceil(line_width / 2))
+            for match in _WORD_RE.finditer(line):
+                tile, left = _render_stroked_word(
+                    match.group(), font_path, font_size, fill, stroke_fill, stroke
+                )
+                dest = round(origin + font.getlength(line[:match.start()])) + left
+                img.alpha_composite(
+                    tile, dest=(max(dest, 0), i * line_height), source=(max(-dest, 0), 0)
+                )
+            continue
+
+        draw.text(
+            (x, i * line_height + stroke),
+            line,
+            font=font,
+            fill=fill,
+            anchor=anchor,
+            stroke_width=stroke,
+            stroke_fill=stroke_fill,
+        )
+
+    array = np.array(img)
+    array.flags.writeable = False
+    return array
+
+
+@lru_cache(maxsize=4096)
+def _render_stroked_word(
+    word: str,
+    font_path: str,
+    font_size: int,
+    fill: tuple[int, int, int],
+    stroke_fill: tuple[int, int, int] | None,
+    stroke: int,
+) -> tuple[Image.Image, int]:
+    """
+    Render one outlined word as a line-height tile (memoized).
+
+    A stroked draw rasterizes every glyph twice (outline, then fill), and
+    caption vocabularies repeat heavily, so render_text builds outlined
+    lines from these tiles instead of redrawing every word.
+
+    Returns:
+        (RGBA tile, x offset of the tile's left edge from the word origin)
+    """
+    font = _load_font(font_path, font_size)
+    ascent, descent = font.getmetrics()
+    left, _, right, _ = font.getbbox(word, stroke_width=stroke, anchor="la")
+
+    tile = Image.new("RGBA", (max(right - left, 1), ascent + descent + 2 * stroke), (0, 0, 0, 0))
+    ImageDraw.Draw(tile).text(
+        (-left, stroke),
+        word,
+        font=font,
+        fill=fill,
+        anchor="la",
+        stroke_width=stroke,
+        stroke_fill=stroke_fill,
+    )
+    return tile, left
+
+
+def render_caption_text(text: str, max_width: int) -> np.ndarray:
+    """
+    Render a caption in the configured caption style, wrapped to max_width.
+
+    Args:
+        text: Caption text
+        max_width: Maximum line width in pixels
+
+    Returns:
+        numpy array of RGBA image
+    """
+    caption = get_settings().caption
+    return render_text(
+        text,
+        caption.font,
+        caption.font_size,
+        caption.color,
+        max_width,
+        stroke_color=caption.stroke_color,
+        stroke_width=caption.stroke_width,
+    )
+
+
+def _ass_color(color: str, default: tuple[int, int, int]) -> str:
+    """Convert a CSS color name or hex string to an ASS &HAABBGGRR color."""
+    try:
+        r, g, b = ImageColor.getrgb(color)[:3]
+    except ValueError:
+        r, g, b = default
+    return f"&H00{b:02X}{g:02X}{r:02X}"
+
+
+def _ass_time(seconds: float) -> str:
+    """Format seconds as an ASS timestamp (H:MM:SS.cc)."""
+    centis = int(round(seconds * 100))
+    secs, centis = divmod(centis, 100)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{centis:02d}"
+
+
+def _ass_text(text: str) -> str:
+    """Neutralize characters that ASS treats as override syntax."""
+    return text.replace("\\", "/").replace("{", "(").replace("}", ")")
+
+
+def _font_family(font_path: str) -> str:
+    """Family name libass needs to find the configured .ttf file."""
+    try:
+        return ImageFont.truetype(font_path, 12).getname()[0]
+    except OSError:
+        return "Arial"
+
+
+def create_ass_captions(
+    transcript: Transcript,
+    output_path: Path,
+    video_size: tuple[int, int],
+    start_after: float = 0.0,
+) -> Path:
+    """
+    Create an ASS subtitle file with karaoke-style word highlighting.
+
+    Mirrors KaraokeCaptions: each word gets an event spanning its timing
+    that shows the whole segment with that word in the highlight color.
+    ffmpeg's libass renders it, so no frames pass through Python.
+
+    Args:
+        transcript: Transcript with word timings
+        output_path: Path to save ASS file
+        video_size: (width, height) of video
+        start_after: Drop words starting before this time (e.g. title card)
+
+    Returns:
+        Path to ASS file
+    """
+    settings = get_settings()
+    caption = settings.caption
+    width, height = video_size
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    primary = _ass_color(caption.color, (255, 255, 255))
+    highlight = _ass_color(caption.highlight_color, (255, 255, 0))
+    outline = _ass_color(caption.stroke_color, (0, 0, 0))
+
+    lines = [
+        "[Script Info]",
+        "ScriptType: v4.00+",
+        f"PlayResX: {width}",
+        f"PlayResY: {height}",
+        "WrapStyle: 0",
+        "ScaledBorderAndShadow: yes",
+        "",
+        "[V4+ Styles]",
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, "
+        "OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, "
+        "ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, "
+        "MarginL, MarginR, MarginV, Encoding",
+        f"Style: Default,{_font_family(caption.font)},{caption.font_size},"
+        f"{primary},{highlight},{outline},&H00000000,0,0,0,0,100,100,0,0,1,"
+        f"{caption.stroke_width},0,5,40,40,0,1",
+        "",
+        "[Events]",
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+    ]
+
+    for segment in transcript.get_segments_v2():
+        words = [_ass_text(w.word) for w in segment.words]
+        for i, word in enumerate(segment.words):
+            if word.start_time < start_after:
+                continue
+            text = " ".join(
+                f"{{\\c{highlight}}}{w}{{\\r}}" if j == i else w
+                for j, w in enumerate(words)
+            )
+            lines.append(
+                f"Dialogue: 0,{_ass_time(word.start_time)},{_ass_time(word.end_time)},"
+                f"Default,,0,0,0,,{text}"
+            )
+
+    output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    logger.info(f"Created ASS file: {output_path}")
+    return output_path
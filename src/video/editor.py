@@ -1,25 +1,90 @@
 """
-Video editor using MoviePy.
+Video editor using ffmpeg and MoviePy.
 Handles trimming, scaling, and format conversion.
 """
 
+import math
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 from loguru import logger
-from moviepy import VideoFileClip, AudioFileClip, TextClip, CompositeVideoClip, ImageClip
 import numpy as np
+from PIL import Image, ImageDraw
 
 from config.settings import get_settings
-
-# Try to import HTML thumbnail generator
-try:
-    from src.video.html_thumbnail import create_html_thumbnail
-    HTML_THUMBNAIL_AVAILABLE = True
+from src.video.captions import render_text
+from src.utils.media import (
+    probe_duration,
+    probe_video,
+    probe_video_format,
+    probe_video_size,
+)
+from src.utils.paths import ensure_dir
+from src.video.encoding import (
+    VideoEncoder,
+    cuda_scaling_available,
+    get_intermediate_encoder,
+    get_video_encoder,
+    hwaccel_args,
+)
+
+
+@lru_cache(maxsize=1)
+def _html_thumbnail_available() -> bool:
+    """Whether the HTML thumbnail generator imports, checked on first use."""
+    try:
+        import src.video.html_thumbnail  # noqa: F401
+    except ImportError as e:
+        logger.warning(f"✗ HTML thumbnail generator not available: {e}")
+        logger.warning("  Install with: pip install html2image")
+        return False
     logger.info("✓ HTML thumbnail generator loaded successfully")
-except ImportError as e:
-    HTML_THUMBNAIL_AVAILABLE = False
-    logger.warning(f"✗ HTML thumbnail generator not available: {e}")
-    logger.warning("  Install with: pip install html2image")
+    return True
+
+
+@lru_cache(maxsize=16)
+def _decode_thumbnail(path: str, inode: int, size: int) -> np.ndarray:
+    """Decode an image to RGBA; inode and size only key the cache."""
+    with Image.open(path) as image:
+        rgba = np.asarray(image.convert("RGBA"))
+    rgba.flags.writeable = False  # Shared between callers
+    return rgba
+
+
+def _load_thumbnail(path: Path) -> np.ndarray:
+    """
+    Read a rendered thumbnail as an RGBA array, kept in memory.
+
+    Re-assembling a story (retries, previews) reuses the decoded image
+    instead of reading and inflating the PNG again. The thumbnail cache
+    touches mtime on every reuse and replaces files rather than
+    rewriting them, so inode and size identify a render.
+    """
+    stat = path.stat()
+    return _decode_thumbnail(str(path), stat.st_ino, stat.st_size)
+
+
+def _run_ffmpeg(args: list[str]) -> None:
+    """Run ffmpeg with `args`, raising with its error output on failure."""
+    result = subprocess.run(
+        ["ffmpeg", "-y", "-v", "error", *args],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed: {result.stderr.strip()}")
+
+
+class BackgroundJob(NamedTuple):
+    """A background to fit to a narration and mux with it."""
+
+    background_path: Path
+    audio_path: Path
+    output_path: Path
 
 
 class VideoEditor:
@@ -27,19 +92,10 @@ class VideoEditor:
 
     def __init__(self):
         self.settings = get_settings()
-        
-        # Check HTML thumbnail availability at init
-        global HTML_THUMBNAIL_AVAILABLE
-        if HTML_THUMBNAIL_AVAILABLE:
-            logger.info("✓ HTML thumbnail rendering is ENABLED")
-        else:
-            logger.warning("✗ HTML thumbnail rendering is DISABLED")
-            logger.warning("  Falling back to template/programmatic generation")
 
     def get_video_duration(self, video_path: Path) -> float:
         """Get duration of a video file in seconds."""
-        with VideoFileClip(str(video_path)) as clip:
-            return clip.duration
+        return probe_video(video_path)[2]
 
     def trim_video(
         self,
@@ -64,33 +120,75 @@ class VideoEditor:
         """
         input_path = Path(input_path)
         output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with VideoFileClip(str(input_path)) as clip:
-            if end_time is not None:
-                trimmed = clip.subclipped(start_time, end_time)
-            elif duration is not None:
-                end = min(start_time + duration, clip.duration)
-                trimmed = clip.subclipped(start_time, end)
-            else:
-                trimmed = clip
-
-            logger.info(f"Trimming video: {start_time}s to {trimmed.duration}s")
-            trimmed.write_videofile(
-                str(output_path),
-                codec="libx264",
-                audio_codec="aac",
-                logger=None,
-            )
+        ensure_dir(output_path.parent)
+
+        if end_time is not None:
+            duration = end_time - start_time
+
+        # Seeking before -i skips the decode of everything before start_time
+        args = [*hwaccel_args(), "-ss", f"{start_time:.3f}", "-i", str(input_path)]
+        if duration is not None:
+            args += ["-t", f"{duration:.3f}"]
+
+        logger.info(f"Trimming video: start={start_time}s, duration={duration}s")
+        _run_ffmpeg([
+            *args,
+            *get_video_encoder().ffmpeg_args(),
+            "-pix_fmt", "yuv420p",
+            "-c:a", "aac",
+            str(output_path),
+        ])
 
         return output_path
 
+    def _encoder(self, is_intermediate: bool) -> VideoEncoder:
+        """Encoder for an output, depending on whether it is re-encoded later."""
+        return get_intermediate_encoder() if is_intermediate else get_video_encoder()
+
+    def _vertical_args(self, source_size: tuple[int, int], width: int, height: int) -> list[str]:
+        """
+        ffmpeg output options that center-crop `source_size` to width:height
+        and scale to it.
+
+        With NVENC, frames are uploaded once and scaled with scale_cuda, so
+        they stay on the GPU through to the encoder.
+        """
+        source_width, source_height = source_size
+
+        # Integer math throughout, with the box and its offset kept even
+        # so the crop lands on whole 4:2:0 chroma samples
+        if source_width * height > source_height * width:
+            # Source is wider - crop sides
+            crop_width = source_height * width // height & ~1
+            crop_height = source_height & ~1
+        else:
+            # Source is taller - crop top/bottom
+            crop_width = source_width & ~1
+            crop_height = source_width * height // width & ~1
+        x = (source_width - crop_width) // 2 & ~1
+        y = (source_height - crop_height) // 2 & ~1
+        crop = f"crop={crop_width}:{crop_height}:{x}:{y}"
+
+        if cuda_scaling_available():
+            # NVENC takes the CUDA frames as-is; a -pix_fmt would force a download
+            return ["-vf", f"{crop},format=nv12,hwupload_cuda,scale_cuda={width}:{height},setsar=1"]
+        return ["-vf", f"{crop},scale={width}:{height},setsar=1", "-pix_fmt", "yuv420p"]
+
+    def _matches_target(self, path: Path, size: tuple[int, int]) -> bool:
+        """Whether a video of `size` at `path` is already in the output format."""
+        video = self.settings.video
+        if size != (video.width, video.height):
+            return False
+        codec, pix_fmt, fps = probe_video_format(path)
+        return codec == "h264" and pix_fmt == "yuv420p" and abs(fps - video.fps) < 0.01
+
     def scale_to_vertical(
         self,
         input_path: Path,
         output_path: Path,
         width: int | None = None,
         height: int | None = None,
+        is_intermediate: bool = False,
     ) -> Path:
         """
         Scale and crop video to vertical 9:16 format.
@@ -100,6 +198,8 @@ class VideoEditor:
             output_path: Output video path
             width: Target width (defaults to config)
             height: Target height (defaults to config)
+            is_intermediate: Output will be re-encoded later, so encode it
+                as cheaply as possible
 
         Returns:
             Path to scaled video
@@ -109,41 +209,18 @@ class VideoEditor:
 
         input_path = Path(input_path)
         output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with VideoFileClip(str(input_path)) as clip:
-            # Calculate crop dimensions to maintain aspect ratio
-            target_ratio = width / height
-            source_ratio = clip.w / clip.h
-
-            if source_ratio > target_ratio:
-                # Source is wider - crop sides
-                new_width = int(clip.h * target_ratio)
-                x_center = clip.w / 2
-                cropped = clip.cropped(
-                    x1=x_center - new_width / 2,
-                    x2=x_center + new_width / 2,
-                )
-            else:
-                # Source is taller - crop top/bottom
-                new_height = int(clip.w / target_ratio)
-                y_center = clip.h / 2
-                cropped = clip.cropped(
-                    y1=y_center - new_height / 2,
-                    y2=y_center + new_height / 2,
-                )
-
-            # Resize to target dimensions
-            scaled = cropped.resized((width, height))
-
-            logger.info(f"Scaling video to {width}x{height}")
-            scaled.write_videofile(
-                str(output_path),
-                codec="libx264",
-                audio_codec="aac",
-                fps=self.settings.video.fps,
-                logger=None,
-            )
+        ensure_dir(output_path.parent)
+
+        logger.info(f"Scaling video to {width}x{height}")
+        _run_ffmpeg([
+            *hwaccel_args(),
+            "-i", str(input_path),
+            *self._vertical_args(probe_video_size(input_path), width, height),
+            *self._encoder(is_intermediate).ffmpeg_args(),
+            "-r", str(self.settings.video.fps),
+            "-c:a", "aac",
+            str(output_path),
+        ])
 
         return output_path
 
@@ -153,73 +230,63 @@ class VideoEditor:
         output_path: Path,
         duration: float,
         loop: bool = True,
+        is_intermediate: bool = False,
     ) -> Path:
         """
         Prepare background video for final assembly.
 
-        Trims/loops video to match target duration and scales to vertical format.
+        Trims/loops video to match target duration and scales to vertical
+        format in a single ffmpeg pass, so each frame is decoded, filtered
+        and encoded once. A source that is already long enough and in the
+        output format is cut with a stream copy instead.
 
         Args:
             input_path: Source video path
             output_path: Output video path
             duration: Target duration in seconds
             loop: Whether to loop if source is shorter
+            is_intermediate: Output will be re-encoded later, so encode it
+                as cheaply as possible
 
         Returns:
             Path to prepared video
         """
         input_path = Path(input_path)
         output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with VideoFileClip(str(input_path)) as clip:
-            # Handle duration
-            if clip.duration >= duration:
-                # Trim to duration
-                prepared = clip.subclipped(0, duration)
-            elif loop:
-                # Loop to reach duration
-                loops_needed = int(duration / clip.duration) + 1
-                prepared = clip.looped(loops_needed).subclipped(0, duration)
-            else:
-                prepared = clip
-
-            # Scale to vertical
-            target_ratio = self.settings.video.width / self.settings.video.height
-            source_ratio = prepared.w / prepared.h
-
-            if source_ratio > target_ratio:
-                new_width = int(prepared.h * target_ratio)
-                x_center = prepared.w / 2
-                prepared = prepared.cropped(
-                    x1=x_center - new_width / 2,
-                    x2=x_center + new_width / 2,
-                )
-            else:
-                new_height = int(prepared.w / target_ratio)
-                y_center = prepared.h / 2
-                prepared = prepared.cropped(
-                    y1=y_center - new_height / 2,
-                    y2=y_center + new_height / 2,
-                )
+        ensure_dir(output_path.parent)
 
-            prepared = prepared.resized(
-                (self.settings.video.width, self.settings.video.height)
-            )
-
-            # Remove audio (will be replaced with TTS)
-            prepared = prepared.without_audio()
+        video = self.settings.video
+        source_width, source_height, source_duration = probe_video(input_path)
 
-            logger.info(
-                f"Prepared background: {prepared.duration:.1f}s, "
-                f"{self.settings.video.width}x{self.settings.video.height}"
-            )
-            prepared.write_videofile(
+        if source_duration >= duration and self._matches_target(input_path, (source_width, source_height)):
+            # Already vertical H.264 at the output rate: cut without re-encoding
+            logger.info(f"Background already matches target format, copying {duration:.1f}s")
+            _run_ffmpeg([
+                "-t", f"{duration:.3f}", "-i", str(input_path),
+                "-map", "0:v:0", "-c", "copy", "-an",
                 str(output_path),
-                codec="libx264",
-                fps=self.settings.video.fps,
-                logger=None,
-            )
+            ])
+            return output_path
+
+        # Loop and cut at the demuxer: exactly enough extra passes, and an
+        # input -t so nothing past the target duration is read or decoded
+        args = hwaccel_args()
+        if loop and 0 < source_duration < duration:
+            args += ["-stream_loop", str(math.ceil(duration / source_duration) - 1)]
+        args += ["-t", f"{duration:.3f}", "-i", str(input_path)]
+
+        logger.info(
+            f"Preparing background: {duration:.1f}s, {video.width}x{video.height}"
+        )
+        _run_ffmpeg([
+            *args,
+            *self._vertical_args((source_width, source_height), video.width, video.height),
+            # Remove audio (will be replaced with TTS)
+            "-an",
+            *self._encoder(is_intermediate).ffmpeg_args(),
+            "-r", str(video.fps),
+            str(output_path),
+        ])
 
         return output_path
 
@@ -232,6 +299,9 @@ class VideoEditor:
         """
         Add audio track to video.
 
+        The video stream is copied as-is and only the audio is encoded, so
+        this is a remux rather than a render.
+
         Args:
             video_path: Video file path
             audio_path: Audio file path
@@ -241,23 +311,61 @@ class VideoEditor:
             Path to video with audio
         """
         output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with VideoFileClip(str(video_path)) as video:
-            with AudioFileClip(str(audio_path)) as audio:
-                final = video.with_audio(audio)
-
-                logger.info(f"Adding audio to video")
-                final.write_videofile(
-                    str(output_path),
-                    codec="libx264",
-                    audio_codec="aac",
-                    fps=self.settings.video.fps,
-                    logger=None,
-                )
+        ensure_dir(output_path.parent)
+
+        logger.info(f"Adding audio to video")
+        _run_ffmpeg([
+            "-i", str(video_path),
+            "-i", str(audio_path),
+            "-map", "0:v:0", "-map", "1:a:0",
+            "-c:v", "copy",
+            "-c:a", self.settings.video.audio_codec, "-b:a", "192k",
+            "-shortest",
+            str(output_path),
+        ])
 
         return output_path
 
+    def process_batch(
+        self,
+        jobs: list[BackgroundJob],
+        max_workers: int | None = None,
+    ) -> list[Optional[Path]]:
+        """
+        Prepare backgrounds and add their audio for several videos at once.
+
+        Each job is a prepare_background pass followed by an add_audio
+        remux. Both are ffmpeg processes, so a thread per job is enough to
+        overlap one job's encode with another's decode and muxing.
+
+        Args:
+            jobs: Background, narration and output path for each video
+            max_workers: Concurrent jobs (defaults to half the CPUs, since
+                each ffmpeg encode is itself multithreaded)
+
+        Returns:
+            Output path for each job in order (None if it failed)
+        """
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 1) // 2)
+
+        def run(job: BackgroundJob) -> Optional[Path]:
+            output_path = Path(job.output_path)
+            prepared_path = output_path.with_suffix(".bg.mp4")
+            try:
+                self.prepare_background(
+                    job.background_path, prepared_path, probe_duration(job.audio_path)
+                )
+                return self.add_audio(prepared_path, job.audio_path, output_path)
+            except Exception as e:
+                logger.error(f"Background job failed for {output_path}: {e}")
+                return None
+            finally:
+                prepared_path.unlink(missing_ok=True)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(run, jobs))
+
     def create_thumbnail_overlay(
         self,
         title: str,
@@ -281,32 +389,37 @@ class VideoEditor:
         Returns:
             List of clips for the thumbnail overlay
         """
+        # MoviePy is only needed here; importing it lazily keeps VideoEditor
+        # cheap to import for the ffmpeg-only paths and worker processes
+        from moviepy import ImageClip
+
+        from src.video.overlay import StaticOverlayClip
+
         width, height = video_size
         clips = []
-        
-        logger.info(f"Creating thumbnail: use_html={use_html}, HTML_THUMBNAIL_AVAILABLE={HTML_THUMBNAIL_AVAILABLE}")
+        html_available = use_html and _html_thumbnail_available()
+
+        logger.info(f"Creating thumbnail: use_html={use_html}, html_available={html_available}")
 
         # Try HTML-based rendering first (best quality, auto-scales perfectly)
-        if use_html and HTML_THUMBNAIL_AVAILABLE:
+        if html_available:
             try:
+                from src.video.html_thumbnail import create_html_thumbnail
+
                 logger.info("🎨 Generating HTML-based thumbnail (auto-scaling)")
-                cache_dir = self.settings.cache_dir
-                cache_dir.mkdir(parents=True, exist_ok=True)
-                
-                html_thumb_path = cache_dir / "html_thumbnail.png"
-                
-                # Call the HTML thumbnail generator
+
+                # The generator caches renders by content, so a story that is
+                # assembled again reuses its PNG instead of starting Chrome
                 logger.info(f"Calling create_html_thumbnail with title: {title[:50]}...")
                 generated_path = create_html_thumbnail(
                     title=title,
                     username=username,
-                    output_path=html_thumb_path,
                     width=int(width * 0.85)
                 )
                 logger.info(f"HTML thumbnail generated at: {generated_path}")
-                
-                # Load the generated HTML thumbnail
-                thumbnail = ImageClip(str(generated_path))
+
+                # Decode once and composite the RGBA image directly
+                thumbnail = StaticOverlayClip(_load_thumbnail(generated_path))
                 
                 # Center it
                 x_position = (width - thumbnail.w) // 2
@@ -328,7 +441,7 @@ class VideoEditor:
                 traceback.print_exc()
                 logger.warning("  Falling back to template/programmatic generation")
                 use_html = False
-        elif use_html and not HTML_THUMBNAIL_AVAILABLE:
+        elif use_html:
             logger.warning("⚠️ HTML rendering requested but not available")
             logger.warning("  Install with: pip install html2image")
             logger.warning("  Falling back to template/programmatic generation")
@@ -358,18 +471,11 @@ class VideoEditor:
         else:
             font_size = min(42, width // 20)
         
-        # Create temporary title clip to measure its height
-        temp_title = TextClip(
-            text=title,
-            font_size=font_size,
-            color='#1A1A1B',
-            font=self.settings.caption.font if hasattr(self.settings.caption, 'font') else 'Arial-Bold',
-            text_align='center',
-            size=(title_text_width, None),
-            method='caption'
-        )
+        # Render the title once; its height drives the card layout
+        font = self.settings.caption.font
+        title_array = render_text(title, font, font_size, '#1A1A1B', title_text_width)
         
-        title_height = temp_title.h
+        title_height = title_array.shape[0]
         
         if use_template:
             # Use template and overlay text
@@ -405,7 +511,7 @@ class VideoEditor:
             title_y = y_position + int(thumbnail.h * 0.48)
             
             title_clip = (
-                temp_title
+                ImageClip(title_array)
                 .with_duration(duration)
                 .with_position(('center', title_y))
             )
@@ -424,111 +530,70 @@ class VideoEditor:
             card_width = target_width
             
             # Create semi-transparent rounded card
-            card_array = np.ones((card_height, card_width, 4), dtype=np.uint8) * 255
-            card_array[:, :, 3] = 245  # Slightly opaque
+            card_array = np.empty((card_height, card_width, 4), dtype=np.uint8)
+            card_array[..., :3] = 255
+            card_array[..., 3] = 245  # Slightly opaque
             
-            # Add rounded corners effect (simple approach)
+            # Rounded corners: one antialiased quarter circle, mirrored
             corner_radius = 30
-            for i in range(corner_radius):
-                alpha = int(255 * (i / corner_radius))
-                # Top-left
-                card_array[i, :i] = [255, 255, 255, alpha]
-                # Top-right
-                card_array[i, -(i+1):] = [255, 255, 255, alpha]
-                # Bottom-left
-                card_array[-(i+1), :i] = [255, 255, 255, alpha]
-                # Bottom-right
-                card_array[-(i+1), -(i+1):] = [255, 255, 255, alpha]
+            y_grid, x_grid = np.ogrid[:corner_radius, :corner_radius]
+            distance = np.hypot(corner_radius - 0.5 - x_grid, corner_radius - 0.5 - y_grid)
+            corner = (np.clip(corner_radius + 0.5 - distance, 0, 1) * 245).astype(np.uint8)
+            card_array[:corner_radius, :corner_radius, 3] = corner
+            card_array[:corner_radius, -corner_radius:, 3] = corner[:, ::-1]
+            card_array[-corner_radius:, :corner_radius, 3] = corner[::-1]
+            card_array[-corner_radius:, -corner_radius:, 3] = corner[::-1, ::-1]
             
             x_position = (width - card_width) // 2
             y_position = (height - card_height) // 2
             
-            card = (
-                ImageClip(card_array)
-                .with_duration(duration)
-                .with_position((x_position, y_position))
-            )
-            clips.append(card)
+            # Everything on the card is static, so it is flattened into one
+            # image and composited onto the video as a single layer
+            card_image = Image.fromarray(card_array, "RGBA")
             
-            # Reddit logo (orange circle)
+            # Reddit logo (orange circle), drawn at 4x and downsampled to antialias
             icon_size = 70
-            icon_array = np.zeros((icon_size, icon_size, 4), dtype=np.uint8)
-            center = icon_size // 2
-            y_grid, x_grid = np.ogrid[:icon_size, :icon_size]
-            mask = (x_grid - center) ** 2 + (y_grid - center) ** 2 <= (icon_size // 2) ** 2
-            icon_array[mask] = [255, 69, 0, 255]  # Reddit orange
-            
-            icon = (
-                ImageClip(icon_array)
-                .with_duration(duration)
-                .with_position((x_position + 30, y_position + 30))
+            icon_image = Image.new("RGBA", (icon_size * 4, icon_size * 4), (0, 0, 0, 0))
+            ImageDraw.Draw(icon_image).ellipse(
+                (0, 0, icon_size * 4 - 1, icon_size * 4 - 1),
+                fill=(255, 69, 0, 255),  # Reddit orange
+            )
+            card_image.alpha_composite(
+                icon_image.resize((icon_size, icon_size), Image.LANCZOS), dest=(30, 30)
             )
-            clips.append(icon)
             
             # Username and subreddit
-            header_text = (
-                TextClip(
-                    text=f"r/{username}\n{username} ✓",
-                    font_size=min(38, width // 22),
-                    color='#1A1A1B',
-                    font=self.settings.caption.font if hasattr(self.settings.caption, 'font') else 'Arial-Bold',
-                    text_align='left',
-                )
-                .with_duration(duration)
-                .with_position((x_position + 120, y_position + 35))
+            header_array = render_text(
+                f"r/{username}\n{username} ✓",
+                font,
+                min(38, width // 22),
+                '#1A1A1B',
+                align='left',
             )
-            clips.append(header_text)
+            card_image.alpha_composite(Image.fromarray(header_array, "RGBA"), dest=(120, 35))
             
-            # Title text
-            title_y = y_position + header_height + 20
-            title_clip = (
-                temp_title
-                .with_duration(duration)
-                .with_position(('center', title_y))
+            # Title text, centered on the video
+            title_x = (width - title_array.shape[1]) // 2 - x_position
+            card_image.alpha_composite(
+                Image.fromarray(title_array, "RGBA"), dest=(title_x, header_height + 20)
             )
-            clips.append(title_clip)
             
-            # Stats at bottom
-            stats_y = y_position + card_height - 70
+            # Stats at bottom: upvotes, comments, share
+            stats_y = card_height - 70
+            stats_font_size = min(32, width // 28)
+            for text, x in (
+                ("⬆ 999 ⬇", 40),
+                ("💬 999", 200),
+                ("↗ Share", card_width - 160),
+            ):
+                stat_array = render_text(text, font, stats_font_size, '#1A1A1B')
+                card_image.alpha_composite(Image.fromarray(stat_array, "RGBA"), dest=(x, stats_y))
             
-            # Upvotes
-            upvote_clip = (
-                TextClip(
-                    text="⬆ 999 ⬇",
-                    font_size=min(32, width // 28),
-                    color='#1A1A1B',
-                    font=self.settings.caption.font if hasattr(self.settings.caption, 'font') else 'Arial'
-                )
-                .with_duration(duration)
-                .with_position((x_position + 40, stats_y))
-            )
-            clips.append(upvote_clip)
-            
-            # Comments
-            comments_clip = (
-                TextClip(
-                    text="💬 999",
-                    font_size=min(32, width // 28),
-                    color='#1A1A1B',
-                    font=self.settings.caption.font if hasattr(self.settings.caption, 'font') else 'Arial'
-                )
-                .with_duration(duration)
-                .with_position((x_position + 200, stats_y))
-            )
-            clips.append(comments_clip)
-            
-            # Share
-            share_clip = (
-                TextClip(
-                    text="↗ Share",
-                    font_size=min(32, width // 28),
-                    color='#1A1A1B',
-                    font=self.settings.caption.font if hasattr(self.settings.caption, 'font') else 'Arial'
-                )
-                .with_duration(duration)
-                .with_position((x_position + card_width - 160, stats_y))
+            card = (
+                StaticOverlayClip(np.array(card_image), duration)
+                .with_position((x_position, y_position))
             )
-            clips.append(share_clip)
+            clips.append(card)
 
         logger.info(f"Created thumbnail overlay for {duration:.1f}s with title height {title_height}px")
         return clips
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""
+Video encoder selection.
+Picks a hardware H.264 encoder when ffmpeg has a working one.
+"""
+
+import subprocess
+from functools import lru_cache
+from typing import NamedTuple
+
+from loguru import logger
+
+from config.settings import get_settings
+
+
+class VideoEncoder(NamedTuple):
+    """Codec and options for MoviePy's write_videofile or an ffmpeg command."""
+
+    codec: str
+    preset: str
+    ffmpeg_params: tuple[str, ...] = ()
+
+    def write_kwargs(self) -> dict:
+        return {
+            "codec": self.codec,
+            "preset": self.preset,
+            "ffmpeg_params": list(self.ffmpeg_params) or None,
+        }
+
+    def ffmpeg_args(self) -> list[str]:
+        """Output options selecting this encoder on an ffmpeg command line."""
+        return ["-c:v", self.codec, "-preset", self.preset, *self.ffmpeg_params]
+
+
+# Hardware encoders in order of preference. VAAPI is left out: it needs a
+# device and an hwupload filter, which MoviePy's raw-frame pipe can't set up.
+HARDWARE_ENCODERS = (
+    VideoEncoder("h264_nvenc", "p4", ("-tune", "hq", "-rc", "vbr", "-cq", "23")),
+    VideoEncoder("h264_videotoolbox", "medium"),
+    VideoEncoder("h264_qsv", "veryfast"),
+)
+
+SOFTWARE_ENCODER = VideoEncoder("libx264", "veryfast")
+
+# Intermediates are re-encoded downstream: spend as little CPU as possible,
+# with a low CRF so the extra generation costs little quality
+INTERMEDIATE_SOFTWARE_ENCODER = VideoEncoder("libx264", "ultrafast", ("-crf", "18"))
+
+
+def _encoder_works(codec: str) -> bool:
+    """Encode one tiny frame to check the encoder is usable, not just built in."""
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-v", "error",
+                "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+                "-frames:v", "1", "-c:v", codec,
+                "-f", "null", "-",
+            ],
+            capture_output=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+@lru_cache(maxsize=1)
+def available_encoders() -> frozenset[str]:
+    """Names of the video encoders compiled into ffmpeg."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    # Lines look like " V....D libx264   libx264 H.264 / AVC ..."
+    names = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and parts[0].startswith("V"):
+            names.add(parts[1])
+    return frozenset(names)
+
+
+@lru_cache(maxsize=1)
+def available_filters() -> frozenset[str]:
+    """Names of the filters compiled into ffmpeg."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-filters"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    # Lines look like " ..C scale   V->V   Scale the input video size ..."
+    names = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) >= 3 and "->" in parts[2]:
+            names.add(parts[1])
+    return frozenset(names)
+
+
+@lru_cache(maxsize=1)
+def available_hwaccels() -> frozenset[str]:
+    """Names of the hardware decoding methods compiled into ffmpeg."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-hwaccels"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    # A "Hardware acceleration methods:" heading, then one name per line
+    return frozenset(result.stdout.split()[3:])
+
+
+def hwaccel_args() -> list[str]:
+    """
+    ffmpeg input options to decode on the GPU of the chosen encoder.
+
+    With NVENC, inputs are decoded with NVDEC. Decoded frames still come
+    back to system memory, since the crop in front of scale_cuda runs on
+    the CPU. Other hardware encoders let ffmpeg pick a decoder and fall
+    back to software; with libx264 decoding stays on the CPU.
+    """
+    encoder = get_video_encoder()
+    if encoder.codec.endswith("_nvenc") and "cuda" in available_hwaccels():
+        return ["-hwaccel", "cuda"]
+    if encoder in HARDWARE_ENCODERS:
+        return ["-hwaccel", "auto"]
+    return []
+
+
+def cuda_scaling_available() -> bool:
+    """Whether frames can be resized on the GPU that feeds the NVENC encoder."""
+    return (
+        get_video_encoder().codec.endswith("_nvenc")
+        and {"hwupload_cuda", "scale_cuda"} <= available_filters()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_video_encoder() -> VideoEncoder:
+    """
+    Choose the encoder for final renders (probed once per process).
+
+    An explicitly configured codec other than libx264 is used as-is.
+    Otherwise the first working hardware encoder wins, falling back to
+    libx264 with a fast preset.
+    """
+    settings = get_settings()
+    codec = settings.video.codec
+
+    if codec != SOFTWARE_ENCODER.codec:
+        return VideoEncoder(codec, "medium")
+
+    if settings.video.hardware_encoding:
+        compiled = available_encoders()
+        for encoder in HARDWARE_ENCODERS:
+            if encoder.codec in compiled and _encoder_works(encoder.codec):
+                logger.info(f"Using hardware video encoder: {encoder.codec}")
+                return encoder
+
+    logger.info(f"Using software video encoder: {SOFTWARE_ENCODER.codec}")
+    return SOFTWARE_ENCODER
+
+
+def get_intermediate_encoder() -> VideoEncoder:
+    """
+    Choose the encoder for files that are re-encoded later (e.g. prepared
+    backgrounds).
+
+    Hardware and explicitly configured encoders are used as for final
+    renders; the libx264 fallback switches to the ultrafast preset.
+    """
+    encoder = get_video_encoder()
+    if encoder == SOFTWARE_ENCODER:
+        return INTERMEDIATE_SOFTWARE_ENCODER
+    return encoder
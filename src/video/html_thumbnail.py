@@ -3,26 +3,311 @@ HTML-based thumbnail generator that auto-scales like a webpage.
 Uses html2image to render HTML/CSS as an image.
 """
 
+import atexit
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
+
 from loguru import logger
+from PIL import Image, ImageDraw
+
+from config.settings import get_settings
+from src.utils.paths import ensure_dir
+from src.video.captions import render_text
 
 try:
+    import websocket
     from html2image import Html2Image
     HTML2IMAGE_AVAILABLE = True
 except ImportError:
+    # HTMLThumbnailGenerator becomes the Pillow renderer (end of module)
     HTML2IMAGE_AVAILABLE = False
-    logger.warning("html2image not available. Install with: pip install html2image")
+
+# Custom flags replace html2image's defaults, so its transparent background
+# and hidden scrollbars are repeated here
+CHROME_FLAGS = [
+    "--default-background-color=00000000",
+    "--hide-scrollbars",
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    # Background services a one-shot screenshot never uses
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-breakpad",
+    "--disable-features=Translate",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+]
+
+_DEVTOOLS_RE = re.compile(r"DevTools listening on (ws://\S+)")
+
+# Most recently used renders kept in the thumbnail cache
+THUMBNAIL_CACHE_SIZE = 64
+
+# Part of the cache key; bump when post-processing of screenshots changes
+_CACHE_VERSION = 2
+
+# The shared Html2Image's output_path is set per screenshot
+_HTI_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _shared_hti() -> "Html2Image":
+    """The process-wide Html2Image; Chrome is located and set up once."""
+    return Html2Image(custom_flags=CHROME_FLAGS)
+
+
+@lru_cache(maxsize=1)
+def _chrome_available() -> bool:
+    """
+    Whether html2image is installed and finds Chrome.
+
+    Decided once per process; Html2Image searches for the browser on
+    every construction and raises when there is none.
+    """
+    if not HTML2IMAGE_AVAILABLE:
+        return False
+    try:
+        _shared_hti()
+    except FileNotFoundError as e:
+        logger.warning(f"Chrome not found, drawing thumbnails with Pillow: {e}")
+        return False
+    return True
+
+
+# IBM Plex Sans weights used by the stylesheet, by file name suffix
+FONT_WEIGHTS = {400: "Regular", 600: "SemiBold", 700: "Bold"}
+FONT_MIME_TYPES = {".woff2": "font/woff2", ".ttf": "font/ttf"}
+
+GOOGLE_FONTS_LINK = (
+    '<link href="https://fonts.googleapis.com/css2?family=IBM+Plex+Sans:wght@400;600;700'
+    '&display=swap" rel="stylesheet">'
+)
+
+
+@lru_cache(maxsize=1)
+def _font_head() -> str:
+    """
+    The <head> markup that provides IBM Plex Sans.
+
+    Font files in assets/fonts (IBMPlexSans-Regular.woff2 and so on, or
+    .ttf) are inlined once as data URIs, so a render never waits on
+    Google Fonts. Without them the page links the stylesheet as before.
+    """
+    fonts_dir = get_settings().assets_dir / "fonts"
+    faces = []
+    for weight, name in FONT_WEIGHTS.items():
+        for suffix, mime_type in FONT_MIME_TYPES.items():
+            path = fonts_dir / f"IBMPlexSans-{name}{suffix}"
+            if path.exists():
+                data = base64.b64encode(path.read_bytes()).decode()
+                faces.append(
+                    "@font-face{font-family:'IBM Plex Sans';"
+                    f"src:url(data:{mime_type};base64,{data});font-weight:{weight};}}"
+                )
+                break
+
+    if not faces:
+        return GOOGLE_FONTS_LINK
+    return f"<style>{''.join(faces)}</style>"
+
+
+class ChromeSession:
+    """
+    One long-lived headless Chrome driven over the DevTools protocol.
+
+    html2image starts a new Chrome for every screenshot. This keeps one
+    browser and one page open and only navigates and captures per
+    thumbnail. Pages are loaded from files, like html2image does, and
+    captured once their load event has fired and web fonts are ready.
+    Not thread-safe; callers serialise on the generator's lock.
+    """
+
+    def __init__(self, executable: str, flags: list[str], timeout: float = 30):
+        self._dir = tempfile.mkdtemp(prefix=f"hti-cdp-{os.getpid()}-")
+        self._proc = subprocess.Popen(
+            [
+                executable,
+                "--headless",
+                "--remote-debugging-port=0",
+                f"--user-data-dir={os.path.join(self._dir, 'profile')}",
+                *flags,
+                "about:blank",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        self._id = 0
+        self._events: list[dict] = []
+        try:
+            endpoint = self._read_endpoint(timeout)
+            self._ws = websocket.create_connection(endpoint, timeout=timeout)
+            target = self._call("Target.createTarget", url="about:blank")["targetId"]
+            self._session = self._call(
+                "Target.attachToTarget", targetId=target, flatten=True
+            )["sessionId"]
+            self._call("Page.enable", page=True)
+            # Same transparent page background as --default-background-color
+            self._call(
+                "Emulation.setDefaultBackgroundColorOverride",
+                page=True,
+                color={"r": 0, "g": 0, "b": 0, "a": 0},
+            )
+        except BaseException:
+            self.close()
+            raise
+
+    def _read_endpoint(self, timeout: float) -> str:
+        """
+        Wait for the browser endpoint Chrome reports on stderr.
+
+        A reader thread scans for it and then keeps draining stderr, so
+        Chrome never blocks on a full pipe. Raises if Chrome exits or
+        stays silent for `timeout` seconds.
+        """
+        found: list[str] = []
+        ready = threading.Event()
+
+        def read() -> None:
+            for line in self._proc.stderr:
+                if not found:
+                    match = _DEVTOOLS_RE.search(line)
+                    if match:
+                        found.append(match.group(1))
+                        ready.set()
+            ready.set()
+
+        threading.Thread(target=read, daemon=True).start()
+        if not ready.wait(timeout):
+            raise TimeoutError(f"Chrome did not open DevTools within {timeout}s")
+        if not found:
+            raise RuntimeError("Chrome exited before opening DevTools")
+        return found[0]
+
+    def _recv(self) -> dict:
+        return json.loads(self._ws.recv())
+
+    def _call(self, method: str, page: bool = False, **params) -> dict:
+        """Send a command and wait for its result, queueing events meanwhile."""
+        self._id += 1
+        message = {"id": self._id, "method": method, "params": params}
+        if page:
+            message["sessionId"] = self._session
+        self._ws.send(json.dumps(message))
+        while True:
+            reply = self._recv()
+            if reply.get("id") != self._id:
+                self._events.append(reply)
+                continue
+            if "error" in reply:
+                raise RuntimeError(f"{method} failed: {reply['error'].get('message')}")
+            return reply.get("result", {})
+
+    def _wait_for(self, event: str) -> None:
+        """Block until `event` arrives, dropping the events before it."""
+        while self._events:
+            if self._events.pop(0).get("method") == event:
+                return
+        while self._recv().get("method") != event:
+            pass
+
+    def screenshot(self, html_content: str, size: tuple[int, int]) -> bytes:
+        """Render a complete HTML document at `size`, returning the PNG."""
+        page_path = Path(self._dir) / "page.html"
+        page_path.write_text(html_content, encoding="utf-8")
+
+        width, height = size
+        self._call(
+            "Emulation.setDeviceMetricsOverride",
+            page=True,
+            width=width,
+            height=height,
+            deviceScaleFactor=1,
+            mobile=False,
+        )
+        self._events.clear()
+        self._call("Page.navigate", page=True, url=page_path.as_uri())
+        self._wait_for("Page.loadEventFired")
+        self._call(
+            "Runtime.evaluate",
+            page=True,
+            expression="document.fonts.ready.then(() => true)",
+            awaitPromise=True,
+        )
+        data = self._call("Page.captureScreenshot", page=True, format="png")["data"]
+        return base64.b64decode(data)
+
+    def close(self) -> None:
+        """Shut the browser down and remove its profile."""
+        ws = getattr(self, "_ws", None)
+        if ws is not None:
+            try:
+                self._call("Browser.close")
+            except Exception:
+                pass
+            ws.close()
+            self._ws = None
+        if self._proc.poll() is None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+
+@lru_cache(maxsize=1)
+def _shared_session() -> ChromeSession | None:
+    """
+    The process-wide ChromeSession, or None to screenshot through
+    html2image when one can't be started.
+    """
+    try:
+        session = ChromeSession(_shared_hti().browser.executable, CHROME_FLAGS)
+    except Exception as e:
+        logger.warning(f"Could not start a persistent Chrome session, using html2image: {e}")
+        return None
+    atexit.register(session.close)
+    return session
+
+
+class ThumbnailJob(NamedTuple):
+    """One thumbnail for HTMLThumbnailGenerator.generate_thumbnails."""
+
+    title: str
+    username: str = "RedditPapi"
+    upvotes: str = "249"
+    comments: str = "57"
+    output_path: Path | None = None
+    width: int = 1080
 
 
 class HTMLThumbnailGenerator:
     """Generate Reddit-style thumbnails using HTML/CSS rendering."""
 
-    def __init__(self):
-        if HTML2IMAGE_AVAILABLE:
-            # Don't set output_path in init, we'll handle it per screenshot
-            self.hti = Html2Image()
+    def __init__(self, hti: "Html2Image | None" = None):
+        if hti is not None:
+            self.hti, self._lock = hti, threading.Lock()
         else:
-            self.hti = None
+            self.hti = _shared_hti()
+            self._lock = _HTI_LOCK
 
     def generate_thumbnail(
         self,
@@ -41,57 +326,125 @@ class HTMLThumbnailGenerator:
             username: Reddit username
             upvotes: Upvote count
             comments: Comment count
-            output_path: Path to save image
+            output_path: Path to save image (default: the cached render)
             width: Width in pixels
 
         Returns:
             Path to generated image
         """
-        if not HTML2IMAGE_AVAILABLE:
-            raise ImportError("html2image is required. Install with: pip install html2image")
+        if output_path is not None:
+            output_path = Path(output_path)
 
-        if output_path is None:
-            output_path = Path("temp") / "thumbnail.png"
-        
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        job = ThumbnailJob(title, username, upvotes, comments, output_path, width)
+        return self.generate_thumbnails([job])[0]
 
-        html_content = self._create_html(title, username, upvotes, comments)
-        css_content = self._create_css()
+    def generate_thumbnails(self, jobs: list[ThumbnailJob]) -> list[Path]:
+        """
+        Generate several thumbnails in one pass.
+
+        Renders are cached on disk by a hash of the page, stylesheet and
+        viewport size, so a thumbnail rendered before is copied instead
+        of screenshotted again. Missing pages are captured in the shared
+        ChromeSession, or, when it can't start (and in pool workers),
+        handed to html2image as lists so its per-call setup is paid once
+        per batch.
 
-        logger.info(f"Generating HTML thumbnail for title: {title[:50]}...")
+        Args:
+            jobs: Thumbnails to render. A job without an output_path
+                gets the cached image's path.
+
+        Returns:
+            Paths to the generated images, in the order of `jobs`
+        """
+        cache_dir = ensure_dir(get_settings().cache_dir / "thumbnails")
 
+        css_content = self._create_css()
+        cache_paths = []
+        missing: dict[Path, tuple[str, tuple[int, int]]] = {}
+        for job in jobs:
+            html_content = self._create_html(job.title, job.username, job.upvotes, job.comments)
+            size = (job.width, self._estimate_height(job.title))
+            key = hashlib.blake2b(
+                f"{_CACHE_VERSION}\0{html_content}\0{css_content}\0{size}".encode(),
+                digest_size=16,
+            ).hexdigest()
+            cache_path = cache_dir / f"{key}.png"
+            cache_paths.append(cache_path)
+
+            if cache_path in missing:
+                continue
+            try:
+                os.utime(cache_path)  # Mark as recently used
+                logger.info(f"Reusing cached thumbnail for title: {job.title[:50]}...")
+            except FileNotFoundError:
+                logger.info(f"Generating HTML thumbnail for title: {job.title[:50]}...")
+                missing[cache_path] = (html_content, size)
+
+        if missing:
+            # Written under a per-thread name and renamed, so concurrent
+            # renders never expose a partly written file
+            tmp_names = [f"{path.stem}.{threading.get_ident()}.png" for path in missing]
+            with self._lock:
+                session = _shared_session() if self._lock is _HTI_LOCK else None
+                if session is not None:
+                    # Trimmed in memory, so each render is written once
+                    for (html_content, size), tmp_name in zip(missing.values(), tmp_names):
+                        data = session.screenshot(
+                            Html2Image._prepare_html_string(html_content, css_content + "\n"),
+                            size,
+                        )
+                        _trim(cache_dir / tmp_name, data)
+                else:
+                    # Set output path for html2image
+                    self.hti.output_path = str(cache_dir)
+
+                    # Generate the images with estimated sizes
+                    self.hti.screenshot(
+                        html_str=[html_content for html_content, _ in missing.values()],
+                        css_str=css_content,
+                        save_as=tmp_names,
+                        size=[size for _, size in missing.values()],
+                    )
+            for path, tmp_name in zip(missing, tmp_names):
+                if session is None:
+                    _trim(cache_dir / tmp_name)
+                os.replace(cache_dir / tmp_name, path)
+            _evict_thumbnails(cache_dir, THUMBNAIL_CACHE_SIZE)
+
+        paths = []
+        for job, cache_path in zip(jobs, cache_paths):
+            if job.output_path is None:
+                paths.append(cache_path)
+                continue
+            ensure_dir(job.output_path.parent)
+            shutil.copyfile(cache_path, job.output_path)
+            paths.append(job.output_path)
+
+        logger.info(f"Generated {len(jobs)} thumbnail(s), {len(missing)} rendered")
+        return paths
+
+    @staticmethod
+    def _estimate_height(title: str) -> int:
+        """Screenshot height for a title, generous enough to avoid clipping."""
         # Estimate height based on title length
-        # Be generous with height to avoid clipping
         base_height = 500  # Increased from 400
         title_lines = len(title) // 35 + 1  # More conservative line estimate
         estimated_height = base_height + (title_lines * 80)  # More space per line
-        
-        # Add extra padding for safety
-        estimated_height = int(estimated_height * 1.3)  # 30% extra buffer
-        
-        # Set output path for html2image
-        self.hti.output_path = str(output_path.parent)
-        
-        # Generate the image with estimated size
-        self.hti.screenshot(
-            html_str=html_content,
-            css_str=css_content,
-            save_as=output_path.name,
-            size=(width, estimated_height)
-        )
 
-        logger.info(f"Thumbnail generated at {output_path} with size {width}x{estimated_height}")
-        return output_path
+        # Add extra padding for safety
+        return int(estimated_height * 1.3)  # 30% extra buffer
 
     def _create_html(self, title: str, username: str, upvotes: str, comments: str) -> str:
         """Create the HTML structure."""
+        # Reddit text is arbitrary; escape it so it can't break the markup
+        title, username = html.escape(title), html.escape(username)
+        upvotes, comments = html.escape(upvotes), html.escape(comments)
         return f"""
         <!DOCTYPE html>
         <html>
         <head>
             <meta charset="UTF-8">
-            <link href="https://fonts.googleapis.com/css2?family=IBM+Plex+Sans:wght@400;600;700&display=swap" rel="stylesheet">
+            {_font_head()}
         </head>
         <body>
             <div class="reddit-card">
@@ -289,6 +642,275 @@ class HTMLThumbnailGenerator:
         """
 
 
+class PillowThumbnailGenerator:
+    """
+    Draw the Reddit card directly with PIL, without a browser.
+
+    Follows the HTML layout (card padding, header, title, action pills)
+    with the caption font from settings. The emoji award row is left
+    out since it needs a color emoji font. Output is the card itself,
+    like a trimmed HTML render, in a few milliseconds instead of a
+    Chrome launch.
+    """
+
+    # Page colors from the stylesheet
+    CARD = (255, 255, 255, 255)
+    PILL = (246, 247, 248, 255)  # #F6F7F8
+    RULE = (237, 239, 241, 255)  # #EDEFF1
+    ORANGE = (255, 69, 0, 255)  # #FF4500
+    PADDING = 32
+
+    def __init__(self, font_path: str | None = None):
+        self.font = font_path or get_settings().caption.font
+
+    def generate_thumbnail(
+        self,
+        title: str,
+        username: str = "RedditPapi",
+        upvotes: str = "249",
+        comments: str = "57",
+        output_path: Path | None = None,
+        width: int = 1080,
+    ) -> Path:
+        """Draw one thumbnail; same arguments as HTMLThumbnailGenerator."""
+        if output_path is not None:
+            output_path = Path(output_path)
+
+        job = ThumbnailJob(title, username, upvotes, comments, output_path, width)
+        return self.generate_thumbnails([job])[0]
+
+    def generate_thumbnails(self, jobs: list[ThumbnailJob]) -> list[Path]:
+        """
+        Draw several thumbnails. A job without an output_path is written
+        to the thumbnail cache directory, and drawn only once.
+        """
+        cache_dir = get_settings().cache_dir / "thumbnails"
+        paths = []
+        for job in jobs:
+            path = job.output_path
+            if path is None:
+                key = hashlib.blake2b(
+                    repr(("pillow", _CACHE_VERSION, self.font, *job)).encode(), digest_size=16
+                ).hexdigest()
+                path = cache_dir / f"{key}.png"
+                try:
+                    os.utime(path)  # Mark as recently used
+                    paths.append(path)
+                    continue
+                except FileNotFoundError:
+                    pass
+            ensure_dir(path.parent)
+            # Renamed into place like HTML renders, so a crash or a
+            # concurrent worker never leaves a partly written cache hit
+            tmp_path = path.with_name(f"{path.stem}.{threading.get_ident()}.png")
+            self.render(job).save(tmp_path, compress_level=1)
+            os.replace(tmp_path, path)
+            paths.append(path)
+
+        if any(job.output_path is None for job in jobs):
+            _evict_thumbnails(cache_dir, THUMBNAIL_CACHE_SIZE)
+        return paths
+
+    # Symbols are drawn as shapes; PIL has no glyph fallback, and
+    # "✓▲▼" are missing from many caption fonts
+    @staticmethod
+    def _check_mark(size: int) -> Image.Image:
+        """A blue check mark, drawn at 4x and downsampled."""
+        scale = size * 4
+        image = Image.new("RGBA", (scale, scale), (0, 0, 0, 0))
+        ImageDraw.Draw(image).line(
+            [(scale * 0.12, scale * 0.55), (scale * 0.4, scale * 0.82), (scale * 0.9, scale * 0.2)],
+            fill="#0079D3",
+            width=max(4, scale // 7),
+            joint="curve",
+        )
+        return image.reduce(4)
+
+    @staticmethod
+    def _arrow(size: int, up: bool) -> Image.Image:
+        """A vote triangle pointing up or down, drawn at 4x and downsampled."""
+        scale = size * 4
+        image = Image.new("RGBA", (scale, scale), (0, 0, 0, 0))
+        top, bottom = (0, scale - 1) if up else (scale - 1, 0)
+        ImageDraw.Draw(image).polygon(
+            [(scale / 2, top), (scale - 1, bottom), (0, bottom)], fill="#1A1A1B"
+        )
+        return image.reduce(4)
+
+    def render(self, job: ThumbnailJob) -> Image.Image:
+        """Draw the card for `job` as an RGBA image."""
+        pad = self.PADDING
+        card_width = min(job.width - 80, 1000)  # body padding, max-width
+        inner_width = card_width - 2 * pad
+
+        def text(value: str, size: int, color: str, max_width: int | None = None) -> Image.Image:
+            array = render_text(value, self.font, size, color, max_width, align="left")
+            return Image.fromarray(array, "RGBA")
+
+        subreddit = text("RedditPapi", 28, "#1A1A1B")
+        username = text(job.username, 22, "#7C7C7C")
+        verified = self._check_mark(20)
+        title = text(job.title, 42, "#1A1A1B", inner_width)
+        upvotes = text(job.upvotes, 24, "#1A1A1B")
+        votes = Image.new("RGBA", (upvotes.width + 2 * (18 + 10), upvotes.height), (0, 0, 0, 0))
+        arrow_y = (upvotes.height - 18) // 2
+        votes.alpha_composite(self._arrow(18, up=True), dest=(0, arrow_y))
+        votes.alpha_composite(upvotes, dest=(18 + 10, 0))
+        votes.alpha_composite(self._arrow(18, up=False), dest=(votes.width - 18, arrow_y))
+        pills = [votes, text(job.comments, 24, "#1A1A1B")]
+        share = text("Share", 24, "#1A1A1B")
+
+        icon_size = 56
+        header_height = max(icon_size, subreddit.height + 4 + max(username.height, verified.height))
+        pill_height = max(pill.height for pill in (*pills, share)) + 24
+        card_height = (
+            pad + header_height + 16 + title.height + 32 + 1 + 20 + pill_height + pad
+        )
+
+        # Rounded card, drawn at 4x and downsampled to antialias the corners
+        mask = Image.new("L", (card_width * 4, card_height * 4), 0)
+        ImageDraw.Draw(mask).rounded_rectangle(
+            (0, 0, card_width * 4 - 1, card_height * 4 - 1), radius=16 * 4, fill=255
+        )
+        card = Image.new("RGBA", (card_width, card_height), self.CARD)
+        card.putalpha(mask.reduce(4))
+
+        # Header: logo, subreddit, username and check mark
+        icon = Image.new("RGBA", (icon_size * 4, icon_size * 4), (0, 0, 0, 0))
+        ImageDraw.Draw(icon).ellipse((0, 0, icon_size * 4 - 1, icon_size * 4 - 1), fill=self.ORANGE)
+        card.alpha_composite(icon.reduce(4), dest=(pad, pad))
+        x = pad + icon_size + 16
+        card.alpha_composite(subreddit, dest=(x, pad))
+        y = pad + subreddit.height + 4
+        card.alpha_composite(username, dest=(x, y))
+        card.alpha_composite(
+            verified, dest=(x + username.width + 6, y + (username.height - verified.height) // 2)
+        )
+
+        y = pad + header_height + 16
+        card.alpha_composite(title, dest=(pad, y))
+        y += title.height + 32
+
+        # Actions: a rule, then pills with the counts and Share on the right
+        draw = ImageDraw.Draw(card)
+        draw.line((pad, y, card_width - pad - 1, y), fill=self.RULE)
+        y += 1 + 20
+        x = pad
+        for label, right in ((pills[0], False), (pills[1], False), (share, True)):
+            pill_width = label.width + 40
+            if right:
+                x = card_width - pad - pill_width
+            draw.rounded_rectangle(
+                (x, y, x + pill_width - 1, y + pill_height - 1),
+                radius=pill_height // 2,
+                fill=self.PILL,
+            )
+            card.alpha_composite(label, dest=(x + 20, y + (pill_height - label.height) // 2))
+            x += pill_width + 24
+
+        return card
+
+
+@lru_cache(maxsize=1)
+def _generator() -> "HTMLThumbnailGenerator | PillowThumbnailGenerator":
+    """The generator shared by create_html_thumbnail calls."""
+    if not _chrome_available():
+        return PillowThumbnailGenerator()
+    return HTMLThumbnailGenerator()
+
+
+def _trim(path: Path, data: bytes | None = None) -> None:
+    """
+    Crop a screenshot to its visible pixels.
+
+    The viewport height is a generous estimate, so screenshots carry a
+    band of transparent page below the card. Dropping it keeps the
+    image to the card and its shadow, which also lets VideoEditor
+    center what is actually drawn.
+
+    Crops the file at `path` in place, or, given the PNG as `data`,
+    writes the result to `path` with a single write.
+    """
+    with Image.open(path if data is None else io.BytesIO(data)) as image:
+        image.load()
+    bbox = image.getchannel("A").getbbox() if "A" in image.getbands() else None
+    if bbox and bbox != (0, 0, *image.size):
+        # Read back once per render; fast compression beats small files
+        image.crop(bbox).save(path, compress_level=1)
+    elif data is not None:
+        path.write_bytes(data)
+
+
+def _evict_thumbnails(cache_dir: Path, keep: int) -> None:
+    """Delete all but the `keep` most recently used cached renders."""
+    # In-flight renders are named <key>.<thread>.png
+    cached = sorted(
+        (p for p in cache_dir.glob("*.png") if "." not in p.stem),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for path in cached[max(keep, 1):]:
+        path.unlink(missing_ok=True)
+
+
+class HTMLThumbnailPool:
+    """
+    Render independent thumbnails in parallel.
+
+    Every screenshot is its own headless Chrome process, so worker
+    threads are enough to keep several renders going at once. Each
+    worker gets its own Html2Image with a private temp directory and
+    Chrome profile (--user-data-dir), so concurrent renders neither
+    share page files nor contend for the profile lock. Without
+    html2image or Chrome, workers draw with PillowThumbnailGenerator. The
+    executor is started on first use.
+    """
+
+    def __init__(self, workers: int | None = None):
+        self.workers = workers or max(1, (os.cpu_count() or 2) // 2)
+        self._executor: ThreadPoolExecutor | None = None
+        self._local = threading.local()
+        self._roots: list[str] = []
+
+    def _start_worker(self) -> None:
+        """Give the calling worker thread its own generator."""
+        if not _chrome_available():
+            self._local.generator = PillowThumbnailGenerator()
+            return
+        root = tempfile.mkdtemp(prefix=f"hti-{os.getpid()}-")
+        self._roots.append(root)
+        hti = Html2Image(
+            temp_path=os.path.join(root, "pages"),
+            custom_flags=[*CHROME_FLAGS, f"--user-data-dir={os.path.join(root, 'profile')}"],
+        )
+        self._local.generator = HTMLThumbnailGenerator(hti)
+
+    def _render(self, job: ThumbnailJob) -> Path:
+        return self._local.generator.generate_thumbnails([job])[0]
+
+    def submit(self, job: ThumbnailJob) -> Future:
+        """Queue a thumbnail; the future resolves to its path."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, initializer=self._start_worker
+            )
+        return self._executor.submit(self._render, job)
+
+    def render(self, jobs: list[ThumbnailJob]) -> list[Path]:
+        """Render `jobs` in parallel, returning paths in the same order."""
+        futures = [self.submit(job) for job in jobs]
+        return [future.result() for future in futures]
+
+    def shutdown(self) -> None:
+        """Stop the workers and remove their temp directories."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for root in self._roots:
+            shutil.rmtree(root, ignore_errors=True)
+        self._roots.clear()
+
+
 # Integration function for VideoEditor
 def create_html_thumbnail(
     title: str,
@@ -308,5 +930,9 @@ def create_html_thumbnail(
     Returns:
         Path to generated thumbnail image
     """
-    generator = HTMLThumbnailGenerator()
-    return generator.generate_thumbnail(title, username, output_path=output_path, width=width)
\ No newline at end of file
+    return _generator().generate_thumbnail(title, username, output_path=output_path, width=width)
+
+
+if not HTML2IMAGE_AVAILABLE:
+    # Same interface, no browser: callers need no availability checks
+    HTMLThumbnailGenerator = PillowThumbnailGenerator
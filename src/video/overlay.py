@@ -0,0 +1,84 @@
+"""
+Static RGBA overlays for MoviePy composites.
+"""
+
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+from moviepy import ImageClip, VideoClip
+from moviepy.tools import compute_position
+from PIL import Image
+
+
+class StaticOverlayClip(ImageClip):
+    """
+    ImageClip for a still RGBA overlay (captions, cards).
+
+    ImageClip.compose_on converts the frame and its float mask back into
+    PIL images on every rendered frame. This clip keeps the RGBA image as
+    a PIL image from the start and alpha-composites it directly. Only
+    position and timing changes are supported, not effects that
+    transform the frame.
+    """
+
+    def __init__(self, rgba: np.ndarray, duration: float | None = None):
+        rgba = np.ascontiguousarray(rgba, dtype=np.uint8)
+        super().__init__(rgba, duration=duration)
+        self.image = Image.fromarray(rgba, "RGBA")
+
+    def compose_on(self, background: Image.Image, t) -> Image.Image:
+        """Alpha-composite the overlay onto `background` at time `t`."""
+        pos = compute_position(
+            self.image.size, background.size, self.pos(t - self.start), self.relative_pos
+        )
+        x, y = int(pos[0]), int(pos[1])
+
+        # alpha_composite needs a non-negative destination; crop instead
+        left, top = max(0, -x), max(0, -y)
+        if left >= self.image.width or top >= self.image.height:
+            return background
+
+        if background.mode != "RGBA":
+            background = background.convert("RGBA")
+        background.alpha_composite(self.image, dest=(x + left, y + top), source=(left, top))
+        return background
+
+
+class OverlayTrack(VideoClip):
+    """
+    Many timed overlays flattened into a single compositing layer.
+
+    CompositeVideoClip walks every layer on every frame, so thousands of
+    word-level caption clips cost O(clips) per frame before any pixel is
+    drawn. The track bisects its overlays' start times to find the few
+    showing at `t`, which lets the outer composite be just the video and
+    one track.
+    """
+
+    def __init__(self, clips: list, size: tuple[int, int], duration: float | None = None):
+        # Stable sort keeps the given layering for clips starting together
+        self.overlays = sorted(clips, key=lambda clip: clip.start)
+        self._starts = [clip.start for clip in self.overlays]
+        self._longest = max((clip.end - clip.start for clip in self.overlays), default=0)
+        if duration is None:
+            duration = max((clip.end for clip in self.overlays), default=0)
+
+        # VideoClip renders frame 0 to infer its size, which needs the size
+        self.size = size
+        super().__init__(frame_function=self._frame, duration=duration)
+
+    def playing_overlays(self, t: float) -> list:
+        """Overlays showing at track time `t`, in layer order."""
+        lo = bisect_left(self._starts, t - self._longest)
+        hi = bisect_right(self._starts, t)
+        return [clip for clip in self.overlays[lo:hi] if clip.end > t]
+
+    def compose_on(self, background: Image.Image, t) -> Image.Image:
+        """Composite the overlays showing at time `t` onto `background`."""
+        for clip in self.playing_overlays(t - self.start):
+            background = clip.compose_on(background, t - self.start)
+        return background
+
+    def _frame(self, t: float) -> np.ndarray:
+        canvas = Image.new("RGBA", self.size, (0, 0, 0, 0))
+        return np.array(self.compose_on(canvas, t + self.start))[:, :, :3]